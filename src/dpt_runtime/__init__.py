@@ -17,20 +17,31 @@ https://www.direct-netware.de/redirect?licenses;mpl2
 #echo(__FILEPATH__)#
 """
 
-__all__ = [ "binary",
+__all__ = [ "async_byte_buffer",
+            "async_socket_reader",
+            "binary",
+            "blocking_fifo_byte_buffer",
             "byte_buffer",
+            "byte_buffer_cursor",
+            "byte_buffer_memory_budget",
+            "byte_buffer_pool",
             "charset",
+            "compressed_spill_file",
             "descriptor_selector",
             "environment",
             "exception_log_trap",
+            "fifo_byte_buffer",
             "file_like_copy_mixin",
+            "frame_decoder",
             "input_filter",
             "io_exception",
             "iterator",
             "not_implemented_class",
             "not_implemented_exception",
             "operation_not_supported_exception",
+            "segmented_buffer",
             "socket_reader",
+            "socket_reader_multiplexer",
             "stacked_dict",
             "supports_mixin",
             "traced_exception",
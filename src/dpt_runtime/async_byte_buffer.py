@@ -0,0 +1,349 @@
+# -*- coding: utf-8 -*-
+
+"""
+direct Python Toolbox
+All-in-one toolbox to encapsulate Python runtime variants
+----------------------------------------------------------------------------
+(C) direct Netware Group - All rights reserved
+https://www.direct-netware.de/redirect?dpt;runtime
+
+This Source Code Form is subject to the terms of the Mozilla Public License,
+v. 2.0. If a copy of the MPL was not distributed with this file, You can
+obtain one at http://mozilla.org/MPL/2.0/.
+----------------------------------------------------------------------------
+https://www.direct-netware.de/redirect?licenses;mpl2
+----------------------------------------------------------------------------
+#echo(dptRuntimeVersion)#
+#echo(__FILEPATH__)#
+"""
+
+# pylint: disable=import-error,invalid-name
+
+from functools import partial
+
+try: import asyncio
+except ImportError: asyncio = None
+
+from .byte_buffer import ByteBuffer
+from .not_implemented_exception import NotImplementedException
+
+class AsyncByteBuffer(object):
+    """
+"AsyncByteBuffer" provides awaitable "read()", "write()" and "drain()"
+methods for a "ByteBuffer". Calls touching the external file are executed
+in an executor to not block the event loop while in-memory calls are
+completed immediately. All calls are executed in the order given.
+
+:author:     direct Netware Group et al.
+:copyright:  (C) direct Netware Group - All rights reserved
+:package:    dpt
+:subpackage: runtime
+:since:      v1.0.4
+:license:    https://www.direct-netware.de/redirect?licenses;mpl2
+             Mozilla Public License, v. 2.0
+    """
+
+    __slots__ = [ "__weakref__", "byte_buffer", "_executor", "_loop", "_pending" ]
+    """
+python.org: __slots__ reserves space for the declared variables and prevents
+the automatic creation of __dict__ and __weakref__ for each instance.
+    """
+
+    def __init__(self, byte_buffer = None, loop = None, executor = None):
+        """
+Constructor __init__(AsyncByteBuffer)
+
+:param byte_buffer: Non-blocking ByteBuffer instance to use
+:param loop: asyncio event loop to use
+:param executor: Executor used for calls touching the external file (the
+                 default one of the event loop if None)
+
+:since: v1.0.4
+        """
+
+        # global: asyncio
+
+        if (asyncio is None): raise NotImplementedException("asyncio is not supported by this Python runtime")
+
+        self.byte_buffer = (ByteBuffer() if (byte_buffer is None) else byte_buffer)
+        """
+Underlying ByteBuffer instance
+        """
+        self._executor = executor
+        """
+Executor used for calls touching the external file
+        """
+        self._loop = loop
+        """
+asyncio event loop in use
+        """
+        self._pending = None
+        """
+Future of the last call not completed immediately
+        """
+    #
+
+    @property
+    def is_writable(self):
+        """
+Returns true if the buffer has not been reset for reading yet.
+
+:return: (bool) True if writable
+:since:  v1.0.4
+        """
+
+        return self.byte_buffer.is_writable
+    #
+
+    @property
+    def size(self):
+        """
+Returns the current size of the buffer.
+
+:return: (int) Size written in bytes
+:since:  v1.0.4
+        """
+
+        return self.byte_buffer.size
+    #
+
+    def _call(self, is_blocking, method, *args):
+        """
+Calls the given method of the underlying buffer. Blocking calls and all
+calls following them until they completed are executed in the executor.
+
+:param is_blocking: True if the call may block
+:param method: Method name
+:param args: Method arguments
+
+:return: (object) Future of the call result
+:since:  v1.0.4
+        """
+
+        loop = self._get_loop()
+        _return = loop.create_future()
+
+        callback = partial(getattr(self.byte_buffer, method), *args)
+        pending = self._pending
+
+        if (pending is not None and pending.done()): pending = None
+
+        if (pending is None and (not is_blocking)):
+            try: _return.set_result(callback())
+            except Exception as handled_exception: _return.set_exception(handled_exception)
+        else:
+            run_callback = partial(self._run_in_executor, loop, callback, _return)
+
+            if (pending is None): run_callback()
+            else: pending.add_done_callback(run_callback)
+
+            self._pending = _return
+        #
+
+        return _return
+    #
+
+    def close(self):
+        """
+python.org: Flush and close this stream.
+
+:return: (object) Future completed after closing
+:since:  v1.0.4
+        """
+
+        return self._call(self._is_file_used(), "close")
+    #
+
+    def drain(self):
+        """
+Waits until all calls executed in the executor have been completed.
+
+:return: (object) Future completed after all pending calls
+:since:  v1.0.4
+        """
+
+        _return = self._get_loop().create_future()
+        pending = self._pending
+
+        if (pending is None or pending.done()): _return.set_result(None)
+        else: pending.add_done_callback(lambda future: (None if (_return.cancelled()) else _return.set_result(None)))
+
+        return _return
+    #
+
+    def _get_loop(self):
+        """
+Returns the asyncio event loop in use.
+
+:return: (object) asyncio event loop
+:since:  v1.0.4
+        """
+
+        # global: asyncio
+
+        if (self._loop is None): self._loop = asyncio.get_event_loop()
+        return self._loop
+    #
+
+    def _is_file_used(self):
+        """
+Returns true if the underlying buffer uses an external file.
+
+:return: (bool) True if an external file is used
+:since:  v1.0.4
+        """
+
+        return (self.byte_buffer.buffer_file is not None)
+    #
+
+    def _is_pending(self):
+        """
+Returns true if a call is executed in the executor. The state of the
+underlying buffer must not be inspected in that case.
+
+:return: (bool) True if a call is pending
+:since:  v1.0.4
+        """
+
+        return (self._pending is not None and (not self._pending.done()))
+    #
+
+    def read(self, n = 0):
+        """
+python.org: Read up to n bytes from the object and return them.
+
+:param n: How many bytes to read from the current position (0 means until
+          EOF)
+
+:return: (object) Future of the data read
+:since:  v1.0.4
+        """
+
+        return self._call(self._is_file_used(), "read", n)
+    #
+
+    def readinto(self, b):
+        """
+python.org: Read bytes into a pre-allocated, writable bytes-like object b
+and return the number of bytes read.
+
+:param b: Writable bytes-like object
+
+:return: (object) Future of the number of bytes read
+:since:  v1.0.4
+        """
+
+        return self._call(self._is_file_used(), "readinto", b)
+    #
+
+    def readline(self, limit = -1):
+        """
+python.org: Read and return one line from the stream.
+
+:param limit: If limit is specified, at most limit bytes will be read.
+
+:return: (object) Future of the line read
+:since:  v1.0.4
+        """
+
+        return self._call(self._is_file_used(), "readline", limit)
+    #
+
+    def _run_in_executor(self, loop, callback, future, pending = None):
+        """
+Executes the given callback in the executor and sets the result of the
+given future.
+
+:param loop: asyncio event loop
+:param callback: Callback to execute
+:param future: Future to set the result for
+:param pending: Future of the previous call completed
+
+:since: v1.0.4
+        """
+
+        # pylint: disable=unused-argument
+
+        if (not future.cancelled()):
+            executor_future = loop.run_in_executor(self._executor, callback)
+            executor_future.add_done_callback(partial(AsyncByteBuffer._set_future_result, future))
+        #
+    #
+
+    def seek(self, offset):
+        """
+python.org: Change the stream position to the given byte offset.
+
+:param offset: Seek to the given offset
+
+:return: (object) Future of the new absolute position
+:since:  v1.0.4
+        """
+
+        return self._call(self._is_file_used(), "seek", offset)
+    #
+
+    def write(self, b):
+        """
+python.org: Write the given bytes or bytearray object, b, to the underlying
+raw stream and return the number of bytes written.
+
+:param b: Bytes data
+
+:return: (object) Future of the number of bytes written
+:since:  v1.0.4
+        """
+
+        return self._call((self._is_pending() or self.byte_buffer.is_write_blocking(len(b))), "write", b)
+    #
+
+    def writelines(self, lines):
+        """
+python.org: Write a list of lines to the stream.
+
+:param lines: Iterable of bytes data
+
+:return: (object) Future completed after writing
+:since:  v1.0.4
+        """
+
+        return self.writev(lines)
+    #
+
+    def writev(self, buffers):
+        """
+Writes the given list of bytes data at once.
+
+:param buffers: Iterable of bytes data
+
+:return: (object) Future of the number of bytes written
+:since:  v1.0.4
+        """
+
+        buffers = list(buffers)
+
+        is_blocking = (self._is_pending()
+                       or self.byte_buffer.is_write_blocking(sum(len(b) for b in buffers))
+                      )
+
+        return self._call(is_blocking, "writev", buffers)
+    #
+
+    @staticmethod
+    def _set_future_result(future, executor_future):
+        """
+Sets the result of the given future based on the executor one.
+
+:param future: Future to set the result for
+:param executor_future: Executor future completed
+
+:since: v1.0.4
+        """
+
+        if (not future.cancelled()):
+            if (executor_future.cancelled()): future.cancel()
+            elif (executor_future.exception() is not None): future.set_exception(executor_future.exception())
+            else: future.set_result(executor_future.result())
+        #
+    #
+#
@@ -0,0 +1,317 @@
+# -*- coding: utf-8 -*-
+
+"""
+direct Python Toolbox
+All-in-one toolbox to encapsulate Python runtime variants
+----------------------------------------------------------------------------
+(C) direct Netware Group - All rights reserved
+https://www.direct-netware.de/redirect?dpt;runtime
+
+This Source Code Form is subject to the terms of the Mozilla Public License,
+v. 2.0. If a copy of the MPL was not distributed with this file, You can
+obtain one at http://mozilla.org/MPL/2.0/.
+----------------------------------------------------------------------------
+https://www.direct-netware.de/redirect?licenses;mpl2
+----------------------------------------------------------------------------
+#echo(dptRuntimeVersion)#
+#echo(__FILEPATH__)#
+"""
+
+# pylint: disable=import-error,invalid-name
+
+from functools import partial
+from time import time
+
+try: import asyncio
+except ImportError: asyncio = None
+
+from dpt_settings import Settings
+
+from .io_exception import IOException
+from .not_implemented_exception import NotImplementedException
+
+class AsyncSocketReader(object):
+    """
+"AsyncSocketReader" provides an awaitable "recv()" method implementing time
+limited read operations from sockets served by an asyncio event loop. The
+socket is set to non-blocking mode.
+
+:author:     direct Netware Group et al.
+:copyright:  (C) direct Netware Group - All rights reserved
+:package:    dpt
+:subpackage: runtime
+:since:      v1.0.4
+:license:    https://www.direct-netware.de/redirect?licenses;mpl2
+             Mozilla Public License, v. 2.0
+    """
+
+    __slots__ = [ "__weakref__", "_loop", "socket", "_timeout" ]
+    """
+python.org: __slots__ reserves space for the declared variables and prevents
+the automatic creation of __dict__ and __weakref__ for each instance.
+    """
+
+    def __init__(self, socket, timeout = None, loop = None):
+        """
+Constructor __init__(AsyncSocketReader)
+
+:param socket: Socket to read from
+:param timeout: Timeout in seconds
+:param loop: asyncio event loop to use
+
+:since: v1.0.4
+        """
+
+        # global: asyncio
+
+        if (asyncio is None): raise NotImplementedException("asyncio is not supported by this Python runtime")
+
+        self._loop = loop
+        """
+asyncio event loop in use
+        """
+        self.socket = socket
+        """
+Underlying socket instance
+        """
+        self._timeout = timeout
+        """
+Timeout in seconds
+        """
+
+        if (self._timeout is None or self._timeout <= 0):
+            self._timeout = int(Settings.get("global_socket_data_timeout", 30))
+        #
+
+        self.socket.setblocking(False)
+    #
+
+    @property
+    def timeout(self):
+        """
+Returns the timeout in seconds.
+
+:return: (float) Timeout value
+:since:  v1.0.4
+        """
+
+        return self._timeout
+    #
+
+    @timeout.setter
+    def timeout(self, timeout):
+        """
+Sets a new timeout.
+
+:param timeout: New timeout value in seconds
+
+:since: v1.0.4
+        """
+
+        self._timeout = timeout
+    #
+
+    def _get_loop(self):
+        """
+Returns the asyncio event loop in use.
+
+:return: (object) asyncio event loop
+:since:  v1.0.4
+        """
+
+        # global: asyncio
+
+        if (self._loop is None): self._loop = asyncio.get_event_loop()
+        return self._loop
+    #
+
+    def _on_recv_into_chunk_done(self, future, view, data_size, timeout_time, cancel_callback, task):
+        """
+Called after a chunk has been received.
+
+:param future: Future of the whole receive operation
+:param view: Memoryview to receive data into
+:param data_size: Size received before this chunk
+:param timeout_time: Time the receive operation ends
+:param cancel_callback: Callback cancelling the chunk task
+:param task: Chunk task completed
+
+:since: v1.0.4
+        """
+
+        # global: asyncio
+
+        future.remove_done_callback(cancel_callback)
+
+        if (not future.cancelled()):
+            if (task.cancelled()): future.cancel()
+            elif (isinstance(task.exception(), asyncio.TimeoutError)): future.set_exception(IOException("Failed to receive data"))
+            elif (task.exception() is not None): future.set_exception(task.exception())
+            else:
+                data_size_received = task.result()
+
+                if (data_size_received == 0): future.set_result(data_size)
+                else: self._recv_into_chunk(future, view, data_size + data_size_received, timeout_time)
+            #
+        #
+    #
+
+    def recv(self, size):
+        """
+Read data from socket.
+
+:param size: Size to receive
+
+:return: (object) Future of the socket data received; Socket reached EOF
+         (closed) if len(returned) < size
+:since:  v1.0.4
+        """
+
+        _return = self._get_loop().create_future()
+
+        if (size > 0):
+            buffer = bytearray(size)
+
+            future = self.recv_into(buffer)
+            future.add_done_callback(partial(AsyncSocketReader._set_recv_result, _return, buffer))
+        else: _return.set_result(None)
+
+        return _return
+    #
+
+    def recv_into(self, buffer, nbytes = 0):
+        """
+Read data from socket into the given buffer.
+
+:param buffer: Writable bytes-like object
+:param nbytes: Size to receive (0 means the size of the buffer)
+
+:return: (object) Future of the number of bytes received; Socket reached
+         EOF (closed) if less than requested
+:since:  v1.0.4
+        """
+
+        _return = self._get_loop().create_future()
+
+        view = memoryview(buffer)
+        if (nbytes > 0): view = view[:nbytes]
+
+        self._recv_into_chunk(_return, view, 0, time() + self.timeout)
+
+        return _return
+    #
+
+    def _recv_into_chunk(self, future, view, data_size, timeout_time):
+        """
+Receives the next chunk of data.
+
+:param future: Future of the whole receive operation
+:param view: Memoryview to receive data into
+:param data_size: Size received so far
+:param timeout_time: Time the receive operation ends
+
+:since: v1.0.4
+        """
+
+        # global: asyncio
+
+        if (data_size >= len(view) or time() >= timeout_time): future.set_result(data_size)
+        else:
+            loop = self._get_loop()
+
+            task = loop.create_task(asyncio.wait_for(self._sock_recv_into(loop, view[data_size:]), self.timeout))
+
+            cancel_callback = lambda _: task.cancel()
+            future.add_done_callback(cancel_callback)
+
+            task.add_done_callback(partial(self._on_recv_into_chunk_done, future, view, data_size, timeout_time, cancel_callback))
+        #
+    #
+
+    @staticmethod
+    def _set_recv_into_copy_result(future, view, recv_future):
+        """
+Copies the data received into the given view and sets its size as result
+of the given future.
+
+:param future: Future to set the result for
+:param view: Memoryview to copy data into
+:param recv_future: Receive future completed
+
+:since: v1.0.4
+        """
+
+        if (not future.cancelled()):
+            if (recv_future.cancelled()): future.cancel()
+            elif (recv_future.exception() is not None): future.set_exception(recv_future.exception())
+            else:
+                data = recv_future.result()
+                view[:len(data)] = data
+
+                future.set_result(len(data))
+            #
+        #
+    #
+
+    @staticmethod
+    def _set_recv_result(future, buffer, recv_into_future):
+        """
+Sets the data received as result of the given future.
+
+:param future: Future to set the result for
+:param buffer: Buffer data has been received into
+:param recv_into_future: Receive future completed
+
+:since: v1.0.4
+        """
+
+        if (not future.cancelled()):
+            if (recv_into_future.cancelled()): future.cancel()
+            elif (recv_into_future.exception() is not None): future.set_exception(recv_into_future.exception())
+            else: future.set_result(memoryview(buffer)[:recv_into_future.result()].tobytes())
+        #
+    #
+
+    def _sock_recv_into(self, loop, view):
+        """
+Receives data from the socket into the given view with
+"loop.sock_recv_into()". Data received with "loop.sock_recv()" is copied
+into the view for event loops not providing it (before Python 3.7).
+
+:param loop: asyncio event loop
+:param view: Memoryview to receive data into
+
+:return: (object) Awaitable of the number of bytes received
+:since:  v1.0.4
+        """
+
+        return (loop.sock_recv_into(self.socket, view)
+                if (hasattr(loop, "sock_recv_into")) else
+                self._sock_recv_into_copy(loop, view)
+               )
+    #
+
+    def _sock_recv_into_copy(self, loop, view):
+        """
+Receives data from the socket with "loop.sock_recv()" and copies it into the
+given view.
+
+:param loop: asyncio event loop
+:param view: Memoryview to receive data into
+
+:return: (object) Future of the number of bytes received
+:since:  v1.0.4
+        """
+
+        # global: asyncio
+
+        _return = loop.create_future()
+
+        recv_future = asyncio.ensure_future(loop.sock_recv(self.socket, len(view)), loop = loop)
+        recv_future.add_done_callback(partial(AsyncSocketReader._set_recv_into_copy_result, _return, view))
+
+        _return.add_done_callback(lambda _: recv_future.cancel())
+
+        return _return
+    #
+#
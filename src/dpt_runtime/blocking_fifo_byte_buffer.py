@@ -0,0 +1,309 @@
+# -*- coding: utf-8 -*-
+
+"""
+direct Python Toolbox
+All-in-one toolbox to encapsulate Python runtime variants
+----------------------------------------------------------------------------
+(C) direct Netware Group - All rights reserved
+https://www.direct-netware.de/redirect?dpt;runtime
+
+This Source Code Form is subject to the terms of the Mozilla Public License,
+v. 2.0. If a copy of the MPL was not distributed with this file, You can
+obtain one at http://mozilla.org/MPL/2.0/.
+----------------------------------------------------------------------------
+https://www.direct-netware.de/redirect?licenses;mpl2
+----------------------------------------------------------------------------
+#echo(dptRuntimeVersion)#
+#echo(__FILEPATH__)#
+"""
+
+from threading import Condition
+from time import time
+
+from dpt_settings import Settings
+
+from .fifo_byte_buffer import FifoByteBuffer
+from .io_exception import IOException
+
+class BlockingFifoByteBuffer(FifoByteBuffer):
+    """
+"BlockingFifoByteBuffer" is a thread safe "FifoByteBuffer" for producer and
+consumer threads. Reads block until data is available or EOF has been
+signaled. Writes block as long as the data not yet read reaches the high
+water mark.
+
+:author:     direct Netware Group et al.
+:copyright:  (C) direct Netware Group - All rights reserved
+:package:    dpt
+:subpackage: runtime
+:since:      v1.0.4
+:license:    https://www.direct-netware.de/redirect?licenses;mpl2
+             Mozilla Public License, v. 2.0
+    """
+
+    __slots__ = [ "_condition", "high_water_mark", "_is_eof_set", "timeout" ]
+    """
+python.org: __slots__ reserves space for the declared variables and prevents
+the automatic creation of __dict__ and __weakref__ for each instance.
+    """
+
+    def __init__(self, high_water_mark = None, timeout = None):
+        """
+Constructor __init__(BlockingFifoByteBuffer)
+
+:param high_water_mark: Size of data not yet read blocking further writes
+:param timeout: Timeout in seconds for blocking calls
+
+:since: v1.0.4
+        """
+
+        FifoByteBuffer.__init__(self)
+
+        self._condition = Condition()
+        """
+Condition used to wait for and signal changes
+        """
+        self.high_water_mark = high_water_mark
+        """
+Size of data not yet read blocking further writes (0 to disable)
+        """
+        self._is_eof_set = False
+        """
+True if the producer signaled EOF
+        """
+        self.timeout = timeout
+        """
+Timeout in seconds for blocking calls
+        """
+
+        if (self.high_water_mark is None):
+            self.high_water_mark = int(Settings.get("dpt_runtime_byte_buffer_high_water_mark", self.file_threshold))
+        #
+
+        if (self.timeout is None or self.timeout <= 0):
+            self.timeout = int(Settings.get("dpt_runtime_byte_buffer_timeout", 30))
+        #
+    #
+
+    @property
+    def is_eof(self):
+        """
+Returns true if EOF has been signaled and all data has been read.
+
+:return: (bool) True if EOF
+:since:  v1.0.4
+        """
+
+        with self._condition: return (self._is_eof_set and self.available < 1)
+    #
+
+    def clear(self, is_file_retained = False):
+        """
+Clears all data and the EOF signal.
+
+:param is_file_retained: True to truncate and retain the external file for
+                         reuse
+
+:return: (bool) True if an external file has been retained
+:since:  v1.0.4
+        """
+
+        with self._condition:
+            self._is_eof_set = False
+
+            _return = FifoByteBuffer.clear(self, is_file_retained)
+            self._condition.notify_all()
+        #
+
+        return _return
+    #
+
+    def read(self, n = 0):
+        """
+python.org: Read up to n bytes from the object and return them. Blocks until
+data is available or EOF has been signaled.
+
+:param n: How many bytes to read (0 means all data available)
+
+:return: (bytes) Data; Empty if EOF
+:since:  v1.0.4
+        """
+
+        with self._condition:
+            self._wait_for_data()
+
+            _return = FifoByteBuffer.read(self, n)
+            self._condition.notify_all()
+        #
+
+        return _return
+    #
+
+    def readinto(self, b):
+        """
+python.org: Read bytes into a pre-allocated, writable bytes-like object b
+and return the number of bytes read. Blocks until data is available or EOF
+has been signaled.
+
+:param b: Writable bytes-like object
+
+:return: (int) Number of bytes read; 0 if EOF
+:since:  v1.0.4
+        """
+
+        with self._condition:
+            self._wait_for_data()
+
+            _return = FifoByteBuffer.readinto(self, b)
+            self._condition.notify_all()
+        #
+
+        return _return
+    #
+
+    def readline(self, limit = -1):
+        """
+python.org: Read and return one line from the stream. Blocks until a line
+is complete, the limit has been reached or EOF has been signaled.
+
+:param limit: If limit is specified, at most limit bytes will be read.
+
+:return: (bytes) Line read
+:since:  v1.0.4
+        """
+
+        _return = b""
+
+        with self._condition:
+            timeout_time = time() + self.timeout
+
+            while (True):
+                self._wait_for_data(timeout_time)
+
+                _return += FifoByteBuffer.readline(self, (limit if (limit < 0) else limit - len(_return)))
+                self._condition.notify_all()
+
+                if (_return[-1:] == b"\n"
+                    or (limit > -1 and len(_return) >= limit)
+                    or (self._is_eof_set and self.available < 1)
+                   ): break
+            #
+        #
+
+        return _return
+    #
+
+    def set_eof(self):
+        """
+Signals that no further data will be written.
+
+:since: v1.0.4
+        """
+
+        with self._condition:
+            self._is_eof_set = True
+            self._condition.notify_all()
+        #
+    #
+
+    def _wait(self, predicate, timeout_time = None):
+        """
+Waits until the given predicate is true. The condition lock must be held.
+
+:param predicate: Predicate callable
+:param timeout_time: Time the wait times out at
+
+:since: v1.0.4
+        """
+
+        if (timeout_time is None): timeout_time = time() + self.timeout
+
+        while (not predicate()):
+            timeout = timeout_time - time()
+            if (timeout <= 0): raise IOException("Timeout occurred while waiting for the buffer")
+
+            self._condition.wait(timeout)
+        #
+    #
+
+    def _wait_for_data(self, timeout_time = None):
+        """
+Waits until data is available or EOF has been signaled. The condition lock
+must be held.
+
+:param timeout_time: Time the wait times out at
+
+:since: v1.0.4
+        """
+
+        self._wait(lambda: (self.available > 0 or self._is_eof_set), timeout_time)
+    #
+
+    def write(self, b):
+        """
+python.org: Write the given bytes or bytearray object, b, to the underlying
+raw stream and return the number of bytes written. Blocks as long as the
+high water mark is reached.
+
+:param b: Bytes data
+
+:return: (int) Number of bytes written
+:since:  v1.0.4
+        """
+
+        with self._condition:
+            if (self._is_eof_set): raise IOException("Can't write to a buffer after EOF has been signaled")
+
+            if (self.high_water_mark > 0):
+                self._wait(lambda: (self.available < self.high_water_mark))
+            #
+
+            _return = FifoByteBuffer.write(self, b)
+            self._condition.notify_all()
+        #
+
+        return _return
+    #
+
+    def _write_buffer_file_from_fd(self, fd, size):
+        """
+Copying in the kernel is not supported as each write has to be
+synchronized with readers.
+
+:param fd: Source file descriptor
+:param size: How many bytes to copy at most
+
+:return: (int) Always None
+:since:  v1.0.4
+        """
+
+        # pylint: disable=unused-argument
+
+        return None
+    #
+
+    def writev(self, buffers):
+        """
+Writes the given list of bytes data at once. Blocks as long as the high
+water mark is reached.
+
+:param buffers: Iterable of bytes data
+
+:return: (int) Number of bytes written
+:since:  v1.0.4
+        """
+
+        with self._condition:
+            if (self._is_eof_set): raise IOException("Can't write to a buffer after EOF has been signaled")
+
+            if (self.high_water_mark > 0):
+                self._wait(lambda: (self.available < self.high_water_mark))
+            #
+
+            _return = FifoByteBuffer.writev(self, buffers)
+            self._condition.notify_all()
+        #
+
+        return _return
+    #
+#
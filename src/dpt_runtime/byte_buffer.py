@@ -17,13 +17,30 @@ https://www.direct-netware.de/redirect?licenses;mpl2
 #echo(__FILEPATH__)#
 """
 
-from io import BytesIO
-from tempfile import TemporaryFile
+import errno
+import hashlib
+import io
+import mmap
+import os
+from tempfile import TemporaryFile, gettempdir
+from threading import Lock
+from uuid import uuid4
 
 from dpt_settings import Settings
 
 from .binary import Binary
+from .byte_buffer_cursor import ByteBufferCursor
+from .byte_buffer_memory_budget import ByteBufferMemoryBudget
+from .compressed_spill_file import CompressedSpillFile
 from .io_exception import IOException
+from .segmented_buffer import SegmentedBuffer
+from .type_exception import TypeException
+from .value_exception import ValueException
+
+try: _IOV_MAX = os.sysconf("SC_IOV_MAX")
+except (AttributeError, EnvironmentError, ValueError): _IOV_MAX = -1
+
+if (_IOV_MAX < 1): _IOV_MAX = 1024
 
 class ByteBuffer(object):
     """
@@ -42,26 +59,37 @@ safe.
 
     # pylint: disable=invalid-name
 
-    __slots__ = [ "__weakref__", "buffer", "buffer_file", "_buffer_reset", "buffer_size", "file_threshold" ]
+    __slots__ = [ "__weakref__", "buffer", "buffer_file", "_buffer_file_spare", "buffer_mmap", "_buffer_reset", "buffer_size", "_digests", "_digests_initial", "file_mmap", "file_threshold", "_is_buffer_file_requested", "_line_offsets", "_memory_reserved", "_read_lock" ]
     """
 python.org: __slots__ reserves space for the declared variables and prevents
 the automatic creation of __dict__ and __weakref__ for each instance.
     """
 
-    def __init__(self):
+    def __init__(self, digests = None):
         """
 Constructor __init__(ByteBuffer)
 
+:param digests: List of "hashlib" algorithm names or hash objects updated
+                with all data written
+
 :since: v1.0.0
         """
 
-        self.buffer = BytesIO()
+        self.buffer = SegmentedBuffer()
         """
-Internal byte buffer
+Internal segmented byte buffer
         """
         self.buffer_file = None
         """
 External file handle
+        """
+        self._buffer_file_spare = None
+        """
+Truncated external file retained for reuse
+        """
+        self.buffer_mmap = None
+        """
+Memory-mapped external file used for reading
         """
         self._buffer_reset = False
         """
@@ -70,11 +98,75 @@ True if the buffer has been reset
         self.buffer_size = 0
         """
 Buffer size in bytes written
+        """
+        self._digests = None
+        """
+Dictionary of hash objects updated with all data written
+        """
+        self._digests_initial = None
+        """
+Dictionary of unused hash object copies to reset the digests from
+        """
+        self.file_mmap = bool(Settings.get("dpt_runtime_byte_buffer_file_mmap", False))
+        """
+True to memory-map the external file once writing ended
         """
         self.file_threshold = int(Settings.get("dpt_runtime_byte_buffer_file_threshold", 5242880))
         """
 Threshold to write the internal buffer to an external file
         """
+        self._is_buffer_file_requested = False
+        """
+True if the internal buffer should be written to an external file
+        """
+        self._line_offsets = None
+        """
+Delimiter and list of line offsets indexed
+        """
+        self._memory_reserved = 0
+        """
+Memory in bytes reserved from the process-wide memory budget
+        """
+        self._read_lock = None
+        """
+Lock used for positional reads of an external file without a descriptor
+        """
+
+        self.set_digests(digests)
+    #
+
+    def __getitem__(self, key):
+        """
+python.org: Called to implement evaluation of self[key].
+
+:param key: Slice of the data to return
+
+:return: (bytes) Data
+:since:  v1.0.4
+        """
+
+        if (not isinstance(key, slice)): raise TypeException("ByteBuffer indices must be slices")
+
+        self._ensure_buffer_reset()
+
+        start, stop, step = key.indices(self.buffer_size)
+        if (step != 1): raise ValueException("ByteBuffer slices do not support steps")
+
+        return (self.read_at(start, stop - start) if (stop > start) else b"")
+    #
+
+    @property
+    def digests(self):
+        """
+Returns the hash objects updated with all data written. They are available
+after the buffer has been reset for reading.
+
+:return: (dict) Dictionary of "hashlib" algorithm names and hash objects
+:since:  v1.0.4
+        """
+
+        if (not self._buffer_reset): raise IOException("Digests are not available before the buffer has been read from")
+        return ({ } if (self._digests is None) else self._digests.copy())
     #
 
     @property
@@ -86,7 +178,10 @@ Returns the buffer object to use.
 :since:  v1.0.0
         """
 
-        return (self.buffer if (self.buffer_file is None) else self.buffer_file)
+        if (self.buffer_mmap is not None): _return = self.buffer_mmap
+        else: _return = (self.buffer if (self.buffer_file is None) else self.buffer_file)
+
+        return _return
     #
 
     @property
@@ -113,6 +208,66 @@ Returns the current size of the buffer.
         return self.buffer_size
     #
 
+    def clear(self, is_file_retained = False):
+        """
+Clears all data and makes the buffer writable again.
+
+:param is_file_retained: True to truncate and retain the external file for
+                         reuse
+
+:return: (bool) True if an external file has been retained
+:since:  v1.0.4
+        """
+
+        if (self.buffer_mmap is not None):
+            # Views exported by "getbuffer()" keep the mapping alive. It is
+            # unmapped as soon as the last of them has been released.
+            try: self.buffer_mmap.close()
+            except BufferError: is_file_retained = False
+
+            self.buffer_mmap = None
+        #
+
+        buffer_file = (self._buffer_file_spare if (self.buffer_file is None) else self.buffer_file)
+
+        self.buffer_file = None
+        self._buffer_file_spare = None
+
+        if (buffer_file is not None):
+            if (is_file_retained):
+                buffer_file.seek(0)
+                buffer_file.truncate()
+
+                self._buffer_file_spare = buffer_file
+            else: buffer_file.close()
+        #
+
+        if (self.buffer is None): self.buffer = SegmentedBuffer()
+        else: self.buffer.close()
+
+        self._release_memory_reserved()
+
+        self._buffer_reset = False
+        self.buffer_size = 0
+        self._line_offsets = None
+
+        if (self._digests is not None):
+            for name in self._digests: self._digests[name] = self._digests_initial[name].copy()
+        #
+
+        return (self._buffer_file_spare is not None)
+    #
+
+    def close(self):
+        """
+python.org: Flush and close this stream.
+
+:since: v1.0.4
+        """
+
+        self.clear()
+    #
+
     def _ensure_buffer_reset(self):
         """
 Resets the buffer ones before first read.
@@ -123,6 +278,393 @@ Resets the buffer ones before first read.
         if (not self._buffer_reset): self.seek(0)
     #
 
+    def find(self, sub, start = 0, end = None):
+        """
+Returns the lowest offset where the given data is found within the range
+given.
+
+:param sub: Data to search for
+:param start: Offset to start searching at (interpreted as in slice
+              notation)
+:param end: Offset to end searching at (interpreted as in slice notation)
+
+:return: (int) Offset found; -1 if not found
+:since:  v1.0.4
+        """
+
+        self._ensure_buffer_reset()
+
+        sub = Binary.bytes(sub)
+
+        is_start_valid = (start is None or start <= self.buffer_size)
+        start, end, _ = slice(start, end).indices(self.buffer_size)
+
+        if (not is_start_valid): _return = -1
+        elif (self.buffer_mmap is not None): _return = self.buffer_mmap.find(sub, start, end)
+        elif (len(sub) < 1): _return = (start if (start <= end) else -1)
+        else:
+            _return = -1
+
+            for offset, data in self._iter_chunks(start, end, len(sub) - 1):
+                position = data.find(sub)
+
+                if (position > -1):
+                    _return = offset + position
+                    break
+                #
+            #
+        #
+
+        return _return
+    #
+
+    def get_cursor(self, position = 0):
+        """
+Returns a new read cursor with its own position sharing the data of this
+buffer. Cursors may be used concurrently from different threads.
+
+:param position: Initial cursor position
+
+:return: (object) ByteBufferCursor instance
+:since:  v1.0.4
+        """
+
+        self._ensure_buffer_reset()
+        if (self._read_lock is None): self._read_lock = Lock()
+
+        return ByteBufferCursor(self, position)
+    #
+
+    def getbuffer(self):
+        """
+Returns a read-only view over the buffer data. This is only supported as
+long as the data is held in memory or the external file is memory-mapped
+and the Python runtime supports views of memory maps (not Python 2).
+Data held in memory in more than one segment is joined on the first call
+which copies it once. Use "getbuffers()" to get views without copying.
+
+:return: (object) Read-only memoryview instance; None if the data has been
+         written to an external file not supporting views
+:since:  v1.0.4
+        """
+
+        self._ensure_buffer_reset()
+
+        if (self.buffer_mmap is not None): _return = self._get_buffer_mmap_view()
+        else: _return = (None if (self.buffer_file is not None) else self.buffer.getbuffer())
+
+        return _return
+    #
+
+    def getbuffers(self):
+        """
+Returns a list of read-only views over the buffer data without copying it.
+This is only supported as long as the data is held in memory or the
+external file is memory-mapped and the Python runtime supports views of
+memory maps (not Python 2).
+
+:return: (list) List of memoryview instances; None if the data has been
+         written to an external file not supporting views
+:since:  v1.0.4
+        """
+
+        self._ensure_buffer_reset()
+
+        if (self.buffer_mmap is not None):
+            _return = self._get_buffer_mmap_view()
+            if (_return is not None): _return = [ _return ]
+        #
+        else: _return = (None if (self.buffer_file is not None) else self.buffer.getbuffers())
+
+        return _return
+    #
+
+    def _get_buffer_mmap_view(self):
+        """
+Returns a read-only view of the memory-mapped external file.
+
+:return: (object) Memoryview instance; None if not supported
+:since:  v1.0.4
+        """
+
+        # Python 2 memory maps do not support the buffer protocol used
+        try: _return = memoryview(self.buffer_mmap)
+        except TypeError: _return = None
+
+        return _return
+    #
+
+    def _get_buffer_file_fd(self):
+        """
+Returns the file descriptor of the external file if it provides one.
+
+:return: (int) File descriptor; None if not available
+:since:  v1.0.4
+        """
+
+        try: _return = self.buffer_file.fileno()
+        except (AttributeError, EnvironmentError, ValueError): _return = None
+
+        return _return
+    #
+
+    def get_line(self, index, delimiter = b"\n"):
+        """
+Returns the line with the given index using an index built once.
+
+:param index: Line index
+:param delimiter: Line delimiter
+
+:return: (bytes) Line including the delimiter
+:since:  v1.0.4
+        """
+
+        line_offsets = self._get_line_offsets(Binary.bytes(delimiter))
+        if (index < 0): index += len(line_offsets)
+
+        if (index < 0 or index >= len(line_offsets)): raise ValueException("Line index out of range")
+
+        end = (self.buffer_size if (index + 1 == len(line_offsets)) else line_offsets[index + 1])
+        return self.read_at(line_offsets[index], end - line_offsets[index])
+    #
+
+    def get_line_count(self, delimiter = b"\n"):
+        """
+Returns the number of lines using an index built once.
+
+:param delimiter: Line delimiter
+
+:return: (int) Number of lines
+:since:  v1.0.4
+        """
+
+        return len(self._get_line_offsets(Binary.bytes(delimiter)))
+    #
+
+    def _get_line_offsets(self, delimiter):
+        """
+Returns the list of line offsets for the given delimiter. The index is
+built on first use.
+
+:param delimiter: Line delimiter
+
+:return: (list) List of line offsets
+:since:  v1.0.4
+        """
+
+        self._ensure_buffer_reset()
+
+        if (self._line_offsets is None or self._line_offsets[0] != delimiter):
+            _return = [ ]
+
+            if (self.buffer_size > 0):
+                _return.append(0)
+
+                for offset, data in self._iter_chunks(0, self.buffer_size, len(delimiter) - 1):
+                    position = data.find(delimiter)
+
+                    while (position > -1):
+                        line_offset = offset + position + len(delimiter)
+                        if (line_offset > _return[-1]): _return.append(line_offset)
+
+                        position = data.find(delimiter, position + len(delimiter))
+                    #
+                #
+
+                if (_return[-1] == self.buffer_size): _return.pop()
+            #
+
+            self._line_offsets = ( delimiter, _return )
+        #
+
+        return self._line_offsets[1]
+    #
+
+    def _get_new_buffer_file(self):
+        """
+Returns a new external file. A retained one is reused if available.
+Otherwise an anonymous memory file is created if requested. An unnamed
+linkable ("O_TMPFILE") or a temporary file in the configured directory is
+created next. The default temporary file is used as fallback. Data is
+compressed if a supported codec is configured.
+
+:return: (object) File object
+:since:  v1.0.4
+        """
+
+        _return = self._buffer_file_spare
+
+        if (_return is None):
+            if (Settings.get("dpt_runtime_byte_buffer_file_backend") == "memfd" and hasattr(os, "memfd_create")):
+                try: _return = io.open(os.memfd_create("dpt_runtime_byte_buffer", os.MFD_CLOEXEC), "w+b")
+                except EnvironmentError: pass
+            #
+
+            directory_path = Settings.get("dpt_runtime_byte_buffer_file_directory")
+
+            if (_return is None and hasattr(os, "O_TMPFILE")):
+                # The file is only accessible by its descriptor. Its mode
+                # matches the one of files created by "persist()" once linked.
+                try:
+                    _return = io.open(os.open((gettempdir() if (directory_path is None) else directory_path),
+                                              os.O_RDWR | os.O_TMPFILE | getattr(os, "O_CLOEXEC", 0),
+                                              0o666
+                                             ),
+                                      "w+b"
+                                     )
+                except EnvironmentError: pass
+            #
+
+            if (_return is None and directory_path is not None):
+                try: _return = TemporaryFile(dir = directory_path)
+                except EnvironmentError: pass
+            #
+
+            if (_return is None): _return = TemporaryFile()
+
+            codec = Settings.get("dpt_runtime_byte_buffer_file_codec")
+            if (codec is not None and CompressedSpillFile.is_codec_supported(codec)): _return = CompressedSpillFile(_return, codec)
+        else: self._buffer_file_spare = None
+
+        return _return
+    #
+
+    def _is_buffer_file_required(self, size):
+        """
+Returns true if the internal buffer holding the given size should be
+written to an external file. Memory is reserved from the process-wide
+memory budget otherwise.
+
+:param size: Size in bytes held in memory
+
+:return: (bool) True if required
+:since:  v1.0.4
+        """
+
+        _return = (self._is_buffer_file_requested or size > self.file_threshold)
+
+        if ((not _return) and size > self._memory_reserved):
+            self._memory_reserved = ByteBufferMemoryBudget.reserve(self, size)
+            _return = (self._memory_reserved < 1)
+        #
+
+        return _return
+    #
+
+    def is_write_blocking(self, size):
+        """
+Returns true if writing data of the given size may access the external
+file. This is the case if it is already used or has been requested, if the
+threshold is exceeded or if memory has to be reserved from a limited
+process-wide memory budget.
+
+:param size: Size in bytes to write
+
+:return: (bool) True if the external file may be accessed
+:since:  v1.0.4
+        """
+
+        size += self.buffer.size
+
+        return (self.buffer_file is not None
+                or self._is_buffer_file_requested
+                or size > self.file_threshold
+                or (size > self._memory_reserved and ByteBufferMemoryBudget.get_limit() > 0)
+               )
+    #
+
+    def _iter_chunks(self, start, end, overlap):
+        """
+Yields the data of the given range in chunks overlapping each other by the
+given size.
+
+:param start: Offset to start at
+:param end: Offset to end at
+:param overlap: Size in bytes consecutive chunks overlap
+
+:return: (object) Generator yielding the offset and data of each chunk
+:since:  v1.0.4
+        """
+
+        chunk_size = max(int(Settings.get("global_io_chunk_size_local", 524288)), 2 * (overlap + 1))
+        offset = start
+
+        while (offset < end):
+            data = self.read_at(offset, min(chunk_size, end - offset))
+            if (len(data) < 1): break
+
+            yield ( offset, data )
+
+            if (offset + len(data) >= end): break
+            offset += len(data) - overlap
+        #
+    #
+
+    def _map_buffer_file(self):
+        """
+Memory-maps the external file for reading. The file is used directly if
+mapping is not supported.
+
+:since: v1.0.4
+        """
+
+        try:
+            self.buffer_file.flush()
+            self.buffer_mmap = mmap.mmap(self.buffer_file.fileno(), 0, access = mmap.ACCESS_READ)
+        except (EnvironmentError, ValueError): pass
+    #
+
+    def persist(self, path):
+        """
+Moves all data to a file with the given path and clears the buffer
+afterwards. An anonymous external file is linked to the path if it is
+located on the same file system. Otherwise data is copied in the kernel
+with "os.copy_file_range()" if supported or in chunks.
+
+:param path: File path to persist data to
+
+:since: v1.0.4
+        """
+
+        self._ensure_buffer_reset()
+
+        fd = (None if (self.buffer_file is None) else self._get_buffer_file_fd())
+        temporary_path = "{0}.{1}.tmp".format(path, uuid4().hex)
+
+        try:
+            is_linked = False
+
+            if (fd is not None
+                and os.link in getattr(os, "supports_dir_fd", ( ))
+                and os.path.isdir("/proc/self/fd")
+               ):
+                self.buffer_file.flush()
+
+                # Relative to a directory descriptor "linkat()" is called with "AT_SYMLINK_FOLLOW"
+                proc_fd = os.open("/proc/self/fd", os.O_RDONLY)
+
+                try:
+                    os.link(str(fd), temporary_path, src_dir_fd = proc_fd)
+                    is_linked = True
+                except EnvironmentError: pass
+                finally: os.close(proc_fd)
+            #
+
+            if (not is_linked):
+                with io.open(os.open(temporary_path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o666), "wb") as target_file:
+                    self._write_to_file(target_file, fd)
+                #
+            #
+
+            getattr(os, "replace", os.rename)(temporary_path, path)
+        except Exception:
+            if (os.path.exists(temporary_path)): os.unlink(temporary_path)
+            raise
+        #
+
+        self.clear()
+    #
+
     def read(self, n = 0):
         """
 python.org: Read up to n bytes from the object and return them.
@@ -137,7 +679,88 @@ python.org: Read up to n bytes from the object and return them.
         self._ensure_buffer_reset()
 
         handle = self.handle
-        return (handle.read() if (n < 1) else handle.read(n))
+
+        if (n > 0): _return = handle.read(n)
+        elif (self.buffer_mmap is None): _return = handle.read()
+        else: _return = handle.read(len(handle) - handle.tell())
+
+        return _return
+    #
+
+    def read_at(self, offset, n):
+        """
+Read up to n bytes from the given offset without changing the stream
+position. External files are read with "os.pread()" if supported.
+
+:param offset: Offset to read from
+:param n: How many bytes to read
+
+:return: (bytes) Data
+:since:  v1.0.4
+        """
+
+        self._ensure_buffer_reset()
+
+        if (self.buffer_mmap is not None): _return = self.buffer_mmap[offset:offset + n]
+        elif (self.buffer_file is None): _return = self.buffer.read_at(offset, n)
+        else:
+            fd = (self._get_buffer_file_fd() if (hasattr(os, "pread")) else None)
+
+            if (fd is not None): _return = os.pread(fd, n, offset)
+            elif (self._read_lock is None): _return = self._read_buffer_file_at(offset, n)
+            else:
+                with self._read_lock: _return = self._read_buffer_file_at(offset, n)
+            #
+        #
+
+        return _return
+    #
+
+    def _read_buffer_file_at(self, offset, n):
+        """
+Read up to n bytes from the given offset of the external file and restores
+its position afterwards.
+
+:param offset: Offset to read from
+:param n: How many bytes to read
+
+:return: (bytes) Data
+:since:  v1.0.4
+        """
+
+        position = self.buffer_file.tell()
+
+        self.buffer_file.seek(offset)
+        _return = self.buffer_file.read(n)
+        self.buffer_file.seek(position)
+
+        return _return
+    #
+
+    def readinto(self, b):
+        """
+python.org: Read bytes into a pre-allocated, writable bytes-like object b
+and return the number of bytes read.
+
+:param b: Writable bytes-like object
+
+:return: (int) Number of bytes read
+:since:  v1.0.4
+        """
+
+        self._ensure_buffer_reset()
+
+        if (self.buffer_mmap is None): _return = self.handle.readinto(b)
+        else:
+            view = memoryview(b)
+
+            data = self.buffer_mmap.read(len(view))
+            _return = len(data)
+
+            view[:_return] = data
+        #
+
+        return _return
     #
 
     def readline(self, limit = -1):
@@ -152,7 +775,43 @@ python.org: Read and return one line from the stream.
         self._ensure_buffer_reset()
 
         handle = self.handle
-        return (handle.readline() if (limit < 0) else handle.readline(limit))
+
+        if (limit < 0): _return = handle.readline()
+        elif (self.buffer_mmap is None): _return = handle.readline(limit)
+        else:
+            position = handle.tell()
+            offset = handle.find(b"\n", position, position + limit)
+
+            _return = handle.read(limit if (offset < 0) else 1 + offset - position)
+        #
+
+        return _return
+    #
+
+    def _release_memory_reserved(self):
+        """
+Releases the memory reserved from the process-wide memory budget.
+
+:since: v1.0.4
+        """
+
+        if (self._memory_reserved > 0):
+            ByteBufferMemoryBudget.release(self)
+            self._memory_reserved = 0
+        #
+
+        self._is_buffer_file_requested = False
+    #
+
+    def request_write_buffer_to_file(self):
+        """
+Requests the internal buffer to be written to an external file on the next
+write or the first read. This method may be called from other threads.
+
+:since: v1.0.4
+        """
+
+        self._is_buffer_file_requested = True
     #
 
     def seek(self, offset):
@@ -165,8 +824,55 @@ python.org: Change the stream position to the given byte offset.
 :since: v1.0.0
         """
 
-        if (not self._buffer_reset): self._buffer_reset = True
-        return self.handle.seek(offset)
+        if (not self._buffer_reset):
+            self._buffer_reset = True
+
+            if (self.buffer_file is None and self._is_buffer_file_requested): self._write_buffer_to_file()
+            if (self.file_mmap and self.buffer_file is not None): self._map_buffer_file()
+        #
+
+        handle = self.handle
+
+        if (self.buffer_mmap is not None and offset > self.buffer_size): offset = self.buffer_size
+
+        _return = handle.seek(offset)
+        if (_return is None): _return = handle.tell()
+
+        return _return
+    #
+
+    def set_digests(self, digests):
+        """
+Sets the hash objects updated with all data written. This is only
+supported before any data has been written.
+
+:param digests: List of "hashlib" algorithm names or hash objects; None to
+                disable hashing. Digests are returned with the name given or
+                the lower-case name of the hash object.
+
+:since: v1.0.4
+        """
+
+        if (self.buffer_size > 0): raise IOException("Digests can not be changed after data has been written")
+
+        self._digests = None
+        self._digests_initial = None
+
+        if (digests is not None and len(digests) > 0):
+            self._digests = { }
+            self._digests_initial = { }
+
+            for digest in digests:
+                if (hasattr(digest, "update")): name = digest.name.lower()
+                else:
+                    name = digest
+                    digest = hashlib.new(digest)
+                #
+
+                self._digests[name] = digest
+                self._digests_initial[name] = digest.copy()
+            #
+        #
     #
 
     def tell(self):
@@ -195,22 +901,284 @@ raw stream and return the number of bytes written.
 
         b = Binary.bytes(b)
 
+        if (self._digests is not None):
+            for digest in self._digests.values(): digest.update(b)
+        #
+
         if (self.buffer_file is None):
             _return = self.buffer.write(b)
+            if (self._is_buffer_file_required(self.buffer.size)): self._write_buffer_to_file()
+        else: _return = self._write_buffer_file(b)
+
+        self.buffer_size += _return
+
+        return _return
+    #
+
+    def _write_buffer_file(self, b):
+        """
+Writes the given data to the external file.
+
+:param b: Bytes data
 
-            if (self.buffer.tell() > self.file_threshold):
-                self.buffer_file = TemporaryFile()
+:return: (int) Number of bytes written
+:since:  v1.0.4
+        """
+
+        _return = self.buffer_file.write(b)
+
+        # Python 2 file objects return None after writing all data
+        if (_return is None): _return = len(b)
+
+        return _return
+    #
 
-                self.buffer.seek(0)
-                self.buffer_file.write(self.buffer.read())
+    def _write_buffer_file_from_fd(self, fd, size):
+        """
+Copies up to size bytes from the given file descriptor to the external file
+in the kernel with "os.copy_file_range()" or "os.splice()".
+
+:param fd: Source file descriptor
+:param size: How many bytes to copy at most
+
+:return: (int) Number of bytes copied; None if not supported. Reading from
+         a non-blocking descriptor without data available raises the
+         corresponding error.
+:since:  v1.0.4
+        """
 
-                self.buffer.close()
-                self.buffer = None
+        target_fd = self._get_buffer_file_fd()
+        if (target_fd is None): return None
+
+        _return = None
+        self.buffer_file.flush()
+
+        for method in ( "copy_file_range", "splice" ):
+            if (hasattr(os, method)):
+                try:
+                    _return = getattr(os, method)(fd, target_fd, size)
+                    break
+                except EnvironmentError as handled_exception:
+                    if (handled_exception.errno not in ( errno.EBADF, errno.EINVAL, errno.ENOSYS, errno.EOPNOTSUPP, errno.EXDEV )): raise
+                #
             #
-        else: _return = self.buffer_file.write(b)
+        #
+
+        if (_return is not None): self.buffer_file.seek(0, os.SEEK_END)
+
+        return _return
+    #
+
+    def _write_buffer_to_file(self):
+        """
+Moves the internal buffer to an external file. Segments are written and
+released one at a time to avoid copying the whole buffer in memory.
+
+:since: v1.0.4
+        """
+
+        self.buffer_file = self._get_new_buffer_file()
+        for segment in self.buffer.pop_segments(): self.buffer_file.write(segment)
+
+        self.buffer = None
+        self._release_memory_reserved()
+    #
+
+    def write_from(self, source, length = None):
+        """
+Writes data read from the given file-like object, socket or file
+descriptor. Data held in memory is read into a reused buffer. File
+descriptors are copied to the external file in the kernel if supported.
+
+:param source: File-like object, socket or file descriptor
+:param length: How many bytes to write at most (None means until EOF)
+
+:return: (int) Number of bytes written
+:since:  v1.0.4
+        """
+
+        if (self._buffer_reset): raise IOException("Can't write to a buffer that has been already read from")
+
+        chunk_size = int(Settings.get("global_io_chunk_size_local", 524288))
+
+        if (isinstance(source, int)): fd = source
+        elif (isinstance(source, io.RawIOBase)): fd = source.fileno()
+        else: fd = None
+
+        _return = 0
+        view = None
+
+        while (length is None or _return < length):
+            if (fd is not None and self.buffer_file is not None and self._digests is None):
+                copied = self._write_buffer_file_from_fd(fd, (0x40000000 if (length is None) else length - _return))
+
+                if (copied is None): fd = None
+                else:
+                    if (copied < 1): break
+
+                    _return += copied
+                    self.buffer_size += copied
+
+                    continue
+                #
+            #
+
+            if (view is None): view = memoryview(bytearray(chunk_size))
+            chunk_view = (view if (length is None or length - _return >= chunk_size) else view[:length - _return])
+
+            if (isinstance(source, int) and hasattr(os, "readv")): size = os.readv(source, [ chunk_view ])
+            elif (isinstance(source, int)):
+                data = os.read(source, len(chunk_view))
+                size = len(data)
+
+                chunk_view[:size] = data
+            elif (hasattr(source, "readinto")): size = source.readinto(chunk_view)
+            elif (hasattr(source, "recv_into")): size = source.recv_into(chunk_view)
+            else:
+                data = source.read(len(chunk_view))
+                size = len(data)
+
+                chunk_view[:size] = data
+            #
+
+            if (not size): break
+
+            self.write(chunk_view[:size])
+            _return += size
+        #
+
+        return _return
+    #
+
+    def _write_to_file(self, target_file, fd = None):
+        """
+Writes all data to the given target file.
+
+:param target_file: Target file object
+:param fd: File descriptor of the external file if available
+
+:since: v1.0.4
+        """
+
+        offset = 0
+
+        if (self.buffer_file is None):
+            for segment in self.buffer.segments: target_file.write(segment)
+            offset = self.buffer_size
+        elif (fd is not None and hasattr(os, "copy_file_range")):
+            self.buffer_file.flush()
+            target_file.flush()
+
+            target_fd = target_file.fileno()
+
+            try:
+                while (offset < self.buffer_size):
+                    copied = os.copy_file_range(fd, target_fd, self.buffer_size - offset, offset, offset)
+                    if (copied < 1): break
+
+                    offset += copied
+                #
+            except EnvironmentError as handled_exception:
+                if (handled_exception.errno not in ( errno.EINVAL, errno.ENOSYS, errno.EOPNOTSUPP, errno.EXDEV )): raise
+            #
+
+            target_file.seek(offset)
+        #
+
+        for _, data in self._iter_chunks(offset, self.buffer_size, 0): target_file.write(data)
+    #
+
+    def writelines(self, lines):
+        """
+python.org: Write a list of lines to the stream.
+
+:param lines: Iterable of bytes data
+
+:since: v1.0.4
+        """
+
+        self.writev(lines)
+    #
+
+    def writev(self, buffers):
+        """
+Writes the given list of bytes data at once. The threshold is only checked
+once and data is written to the external file with one system call if
+supported.
+
+:param buffers: Iterable of bytes data
+
+:return: (int) Number of bytes written
+:since:  v1.0.4
+        """
+
+        if (self._buffer_reset): raise IOException("Can't write to a buffer that has been already read from")
+
+        buffers = [ Binary.bytes(b) for b in buffers ]
+
+        if (self._digests is not None):
+            for digest in self._digests.values():
+                for b in buffers: digest.update(b)
+            #
+        #
+
+        if (self.buffer_file is None):
+            _return = 0
+            for b in buffers: _return += self.buffer.write(b)
+
+            if (self._is_buffer_file_required(self.buffer.size)): self._write_buffer_to_file()
+        else: _return = self._writev_buffer_file(buffers)
 
         self.buffer_size += _return
 
         return _return
     #
+
+    def _writev_buffer_file(self, buffers):
+        """
+Writes the given list of bytes data to the external file at its current
+position. "os.writev()" is used if the file provides a descriptor.
+
+:param buffers: List of bytes data
+
+:return: (int) Number of bytes written
+:since:  v1.0.4
+        """
+
+        # global: _IOV_MAX
+
+        fd = (self._get_buffer_file_fd() if (hasattr(os, "writev")) else None)
+
+        if (fd is None):
+            _return = 0
+            for b in buffers: _return += self._write_buffer_file(b)
+        else:
+            self.buffer_file.flush()
+
+            _return = 0
+            buffers = [ memoryview(b) for b in buffers if len(b) > 0 ]
+            index = 0
+
+            while (index < len(buffers)):
+                batch = buffers[index:index + _IOV_MAX]
+
+                written = os.writev(fd, batch)
+                _return += written
+
+                for b in batch:
+                    if (written < len(b)):
+                        buffers[index] = b[written:]
+                        break
+                    #
+
+                    written -= len(b)
+                    index += 1
+                #
+            #
+
+            self.buffer_file.seek(0, os.SEEK_END)
+        #
+
+        return _return
+    #
 #
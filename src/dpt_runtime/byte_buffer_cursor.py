@@ -0,0 +1,178 @@
+# -*- coding: utf-8 -*-
+
+"""
+direct Python Toolbox
+All-in-one toolbox to encapsulate Python runtime variants
+----------------------------------------------------------------------------
+(C) direct Netware Group - All rights reserved
+https://www.direct-netware.de/redirect?dpt;runtime
+
+This Source Code Form is subject to the terms of the Mozilla Public License,
+v. 2.0. If a copy of the MPL was not distributed with this file, You can
+obtain one at http://mozilla.org/MPL/2.0/.
+----------------------------------------------------------------------------
+https://www.direct-netware.de/redirect?licenses;mpl2
+----------------------------------------------------------------------------
+#echo(dptRuntimeVersion)#
+#echo(__FILEPATH__)#
+"""
+
+from .value_exception import ValueException
+
+class ByteBufferCursor(object):
+    """
+"ByteBufferCursor" reads the data of a "ByteBuffer" with its own position.
+Data is read with positional reads only. Several cursors of the same buffer
+may therefore be used concurrently without copying the data.
+
+:author:     direct Netware Group et al.
+:copyright:  (C) direct Netware Group - All rights reserved
+:package:    dpt
+:subpackage: runtime
+:since:      v1.0.4
+:license:    https://www.direct-netware.de/redirect?licenses;mpl2
+             Mozilla Public License, v. 2.0
+    """
+
+    LINE_CHUNK_SIZE = 4096
+    """
+Size of each chunk read while searching for a line end
+    """
+
+    __slots__ = [ "__weakref__", "byte_buffer", "_position" ]
+    """
+python.org: __slots__ reserves space for the declared variables and prevents
+the automatic creation of __dict__ and __weakref__ for each instance.
+    """
+
+    def __init__(self, byte_buffer, position = 0):
+        """
+Constructor __init__(ByteBufferCursor)
+
+:param byte_buffer: ByteBuffer instance to read from
+:param position: Initial cursor position
+
+:since: v1.0.4
+        """
+
+        self.byte_buffer = byte_buffer
+        """
+ByteBuffer instance read from
+        """
+        self._position = 0
+        """
+Current cursor position
+        """
+
+        self.seek(position)
+    #
+
+    @property
+    def size(self):
+        """
+Returns the size of the buffer.
+
+:return: (int) Size in bytes
+:since:  v1.0.4
+        """
+
+        return self.byte_buffer.size
+    #
+
+    def read(self, n = 0):
+        """
+python.org: Read up to n bytes from the object and return them.
+
+:param n: How many bytes to read from the current position (0 means until
+          EOF)
+
+:return: (bytes) Data
+:since:  v1.0.4
+        """
+
+        if (n < 1): n = self.byte_buffer.size - self._position
+
+        _return = (self.byte_buffer.read_at(self._position, n) if (n > 0) else b"")
+        self._position += len(_return)
+
+        return _return
+    #
+
+    def readinto(self, b):
+        """
+python.org: Read bytes into a pre-allocated, writable bytes-like object b
+and return the number of bytes read.
+
+:param b: Writable bytes-like object
+
+:return: (int) Number of bytes read
+:since:  v1.0.4
+        """
+
+        view = memoryview(b)
+
+        data = (self.read(len(view)) if (len(view) > 0) else b"")
+        _return = len(data)
+
+        view[:_return] = data
+
+        return _return
+    #
+
+    def readline(self, limit = -1):
+        """
+python.org: Read and return one line from the stream.
+
+:param limit: If limit is specified, at most limit bytes will be read.
+
+:return: (bytes) Line read
+:since:  v1.0.4
+        """
+
+        size = self.byte_buffer.size
+        end = (size if (limit is None or limit < 0) else min(self._position + limit, size))
+        data_list = [ ]
+
+        while (self._position < end):
+            data = self.byte_buffer.read_at(self._position, min(ByteBufferCursor.LINE_CHUNK_SIZE, end - self._position))
+            if (len(data) < 1): break
+
+            line_end = data.find(b"\n")
+            if (line_end > -1): data = data[:line_end + 1]
+
+            data_list.append(data)
+            self._position += len(data)
+
+            if (line_end > -1): break
+        #
+
+        return b"".join(data_list)
+    #
+
+    def seek(self, offset):
+        """
+python.org: Change the stream position to the given byte offset.
+
+:param offset: Seek to the given offset
+
+:return: (int) Return the new absolute position.
+:since:  v1.0.4
+        """
+
+        if (offset < 0): raise ValueException("Negative seek position {0:d}".format(offset))
+
+        self._position = offset
+        return self._position
+    #
+
+    def tell(self):
+        """
+python.org: Return the current stream position.
+
+:return: (int) Stream position
+:since:  v1.0.4
+        """
+
+        return self._position
+    #
+#
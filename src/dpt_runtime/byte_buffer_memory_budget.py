@@ -0,0 +1,241 @@
+# -*- coding: utf-8 -*-
+
+"""
+direct Python Toolbox
+All-in-one toolbox to encapsulate Python runtime variants
+----------------------------------------------------------------------------
+(C) direct Netware Group - All rights reserved
+https://www.direct-netware.de/redirect?dpt;runtime
+
+This Source Code Form is subject to the terms of the Mozilla Public License,
+v. 2.0. If a copy of the MPL was not distributed with this file, You can
+obtain one at http://mozilla.org/MPL/2.0/.
+----------------------------------------------------------------------------
+https://www.direct-netware.de/redirect?licenses;mpl2
+----------------------------------------------------------------------------
+#echo(dptRuntimeVersion)#
+#echo(__FILEPATH__)#
+"""
+
+from threading import RLock
+from weakref import ref
+
+from dpt_settings import Settings
+
+class ByteBufferMemoryBudget(object):
+    """
+"ByteBufferMemoryBudget" accounts the memory used by all "ByteBuffer"
+instances of the process. Buffers reserve memory in small steps. The
+budget is a hard limit: A reservation exceeding it is denied and the buffer
+requesting it has to move its data to an external file. Larger buffers
+still being written are requested to do so as well to make room for later
+reservations. Their memory is accounted for until they did.
+
+:author:     direct Netware Group et al.
+:copyright:  (C) direct Netware Group - All rights reserved
+:package:    dpt
+:subpackage: runtime
+:since:      v1.0.4
+:license:    https://www.direct-netware.de/redirect?licenses;mpl2
+             Mozilla Public License, v. 2.0
+    """
+
+    RESERVATION_SIZE = 4096
+    """
+Memory is reserved in multiples of this size. It is kept small to not
+account small buffers with much more memory than they use while still
+allowing them to grow without a reservation for each write.
+    """
+
+    __slots__ = [ ]
+    """
+python.org: __slots__ reserves space for the declared variables and prevents
+the automatic creation of __dict__ and __weakref__ for each instance.
+    """
+    _buffers = { }
+    """
+Dictionary of weak buffer references with the size reserved and a flag if
+the buffer has been requested to release its memory
+    """
+    _collected_references = [ ]
+    """
+Weak references of buffers collected but not yet removed
+    """
+    _limit = None
+    """
+Memory budget in bytes for all buffers
+    """
+    _lock = RLock()
+    """
+Lock used to change the memory usage
+    """
+    _usage = 0
+    """
+Memory in bytes reserved by all buffers
+    """
+
+    @staticmethod
+    def get_limit():
+        """
+Returns the memory budget in bytes for all buffers.
+
+:return: (int) Memory budget in bytes; 0 if unlimited
+:since:  v1.0.4
+        """
+
+        _return = ByteBufferMemoryBudget._limit
+
+        if (_return is None):
+            _return = int(Settings.get("dpt_runtime_byte_buffer_memory_budget", 0))
+            ByteBufferMemoryBudget._limit = _return
+        #
+
+        return _return
+    #
+
+    @staticmethod
+    def get_usage():
+        """
+Returns the memory in bytes reserved by all buffers.
+
+:return: (int) Memory usage in bytes
+:since:  v1.0.4
+        """
+
+        with ByteBufferMemoryBudget._lock:
+            ByteBufferMemoryBudget._remove_collected_references()
+            return ByteBufferMemoryBudget._usage
+        #
+    #
+
+    @staticmethod
+    def _on_buffer_collected(reference):
+        """
+Called for a buffer being garbage collected.
+
+:param reference: Weak buffer reference
+
+:since: v1.0.4
+        """
+
+        ByteBufferMemoryBudget._collected_references.append(reference)
+    #
+
+    @staticmethod
+    def release(byte_buffer):
+        """
+Releases the memory reserved by the given buffer.
+
+:param byte_buffer: ByteBuffer instance
+
+:since: v1.0.4
+        """
+
+        with ByteBufferMemoryBudget._lock:
+            ByteBufferMemoryBudget._remove_collected_references()
+
+            reservation = ByteBufferMemoryBudget._buffers.pop(ref(byte_buffer), None)
+            if (reservation is not None): ByteBufferMemoryBudget._usage -= reservation[0]
+        #
+    #
+
+    @staticmethod
+    def _remove_collected_references():
+        """
+Removes the reservations of buffers garbage collected. The lock must be
+held.
+
+:since: v1.0.4
+        """
+
+        while (len(ByteBufferMemoryBudget._collected_references) > 0):
+            reference = ByteBufferMemoryBudget._collected_references.pop()
+
+            reservation = ByteBufferMemoryBudget._buffers.pop(reference, None)
+            if (reservation is not None): ByteBufferMemoryBudget._usage -= reservation[0]
+        #
+    #
+
+    @staticmethod
+    def reserve(byte_buffer, size):
+        """
+Reserves memory for the given buffer holding the given size in memory.
+
+:param byte_buffer: ByteBuffer instance
+:param size: Size in bytes held in memory
+
+:return: (int) Size reserved; 0 if the buffer has to release its memory
+:since:  v1.0.4
+        """
+
+        _return = (1 + (size - 1) // ByteBufferMemoryBudget.RESERVATION_SIZE) * ByteBufferMemoryBudget.RESERVATION_SIZE
+        limit = ByteBufferMemoryBudget.get_limit()
+
+        with ByteBufferMemoryBudget._lock:
+            ByteBufferMemoryBudget._remove_collected_references()
+
+            reference = ref(byte_buffer)
+            reservation = ByteBufferMemoryBudget._buffers.get(reference)
+
+            usage = ByteBufferMemoryBudget._usage + _return
+            if (reservation is not None): usage -= reservation[0]
+
+            if (limit > 0 and usage > limit):
+                excess = usage - limit
+
+                reservations = sorted(ByteBufferMemoryBudget._buffers.items(),
+                                      key = lambda item: item[1][0],
+                                      reverse = True
+                                     )
+
+                for buffer_reference, buffer_reservation in reservations:
+                    if (buffer_reservation[0] <= _return): break
+                    if (buffer_reference == reference): continue
+
+                    _buffer = buffer_reference()
+                    if (_buffer is None or (not _buffer.is_writable)): continue
+
+                    if (not buffer_reservation[1]):
+                        buffer_reservation[1] = True
+                        _buffer.request_write_buffer_to_file()
+                    #
+
+                    excess -= buffer_reservation[0]
+                    if (excess <= 0): break
+                #
+
+                if (reservation is not None):
+                    ByteBufferMemoryBudget._usage -= reservation[0]
+                    del ByteBufferMemoryBudget._buffers[reference]
+                #
+
+                _return = 0
+            #
+
+            if (_return > 0):
+                if (reservation is None):
+                    reservation = [ 0, False ]
+                    ByteBufferMemoryBudget._buffers[ref(byte_buffer, ByteBufferMemoryBudget._on_buffer_collected)] = reservation
+                #
+
+                ByteBufferMemoryBudget._usage = usage
+                reservation[0] = _return
+            #
+        #
+
+        return _return
+    #
+
+    @staticmethod
+    def set_limit(limit):
+        """
+Sets the memory budget in bytes for all buffers.
+
+:param limit: Memory budget in bytes; 0 if unlimited
+
+:since: v1.0.4
+        """
+
+        ByteBufferMemoryBudget._limit = int(limit)
+    #
+#
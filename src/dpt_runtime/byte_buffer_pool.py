@@ -0,0 +1,192 @@
+# -*- coding: utf-8 -*-
+
+"""
+direct Python Toolbox
+All-in-one toolbox to encapsulate Python runtime variants
+----------------------------------------------------------------------------
+(C) direct Netware Group - All rights reserved
+https://www.direct-netware.de/redirect?dpt;runtime
+
+This Source Code Form is subject to the terms of the Mozilla Public License,
+v. 2.0. If a copy of the MPL was not distributed with this file, You can
+obtain one at http://mozilla.org/MPL/2.0/.
+----------------------------------------------------------------------------
+https://www.direct-netware.de/redirect?licenses;mpl2
+----------------------------------------------------------------------------
+#echo(dptRuntimeVersion)#
+#echo(__FILEPATH__)#
+"""
+
+from contextlib import contextmanager
+from threading import Lock
+
+from dpt_settings import Settings
+
+from .byte_buffer import ByteBuffer
+
+class ByteBufferPool(object):
+    """
+"ByteBufferPool" hands out cleared "ByteBuffer" instances for reuse. Idle
+buffers may retain their truncated external file to avoid creating a new
+one for the next spill. Released buffers are reset to the configured
+defaults.
+
+:author:     direct Netware Group et al.
+:copyright:  (C) direct Netware Group - All rights reserved
+:package:    dpt
+:subpackage: runtime
+:since:      v1.0.4
+:license:    https://www.direct-netware.de/redirect?licenses;mpl2
+             Mozilla Public License, v. 2.0
+    """
+
+    __slots__ = [ "__weakref__", "_buffers", "_buffers_with_file", "_file_mmap", "_file_threshold", "_lock", "retained_files", "size" ]
+    """
+python.org: __slots__ reserves space for the declared variables and prevents
+the automatic creation of __dict__ and __weakref__ for each instance.
+    """
+
+    def __init__(self, size = None, retained_files = None):
+        """
+Constructor __init__(ByteBufferPool)
+
+:param size: Maximum number of idle buffers
+:param retained_files: Maximum number of idle buffers retaining an external
+                       file
+
+:since: v1.0.4
+        """
+
+        self._buffers = [ ]
+        """
+Idle buffers
+        """
+        self._buffers_with_file = [ ]
+        """
+Idle buffers retaining an external file
+        """
+        self._file_mmap = bool(Settings.get("dpt_runtime_byte_buffer_file_mmap", False))
+        """
+Default memory-map setting of buffers
+        """
+        self._file_threshold = int(Settings.get("dpt_runtime_byte_buffer_file_threshold", 5242880))
+        """
+Default external file threshold of buffers
+        """
+        self._lock = Lock()
+        """
+Lock used to access the idle buffers
+        """
+        self.retained_files = retained_files
+        """
+Maximum number of idle buffers retaining an external file
+        """
+        self.size = size
+        """
+Maximum number of idle buffers
+        """
+
+        if (self.retained_files is None):
+            self.retained_files = int(Settings.get("dpt_runtime_byte_buffer_pool_retained_files", 8))
+        #
+
+        if (self.size is None): self.size = int(Settings.get("dpt_runtime_byte_buffer_pool_size", 32))
+    #
+
+    def __len__(self):
+        """
+python.org: Called to implement the built-in function len().
+
+:return: (int) Number of idle buffers
+:since:  v1.0.4
+        """
+
+        with self._lock: return len(self._buffers) + len(self._buffers_with_file)
+    #
+
+    def acquire(self):
+        """
+Returns an empty buffer. Idle buffers retaining an external file are handed
+out first.
+
+:return: (object) ByteBuffer instance
+:since:  v1.0.4
+        """
+
+        _return = None
+
+        with self._lock:
+            if (len(self._buffers_with_file) > 0): _return = self._buffers_with_file.pop()
+            elif (len(self._buffers) > 0): _return = self._buffers.pop()
+        #
+
+        if (_return is None): _return = ByteBuffer()
+
+        return _return
+    #
+
+    @contextmanager
+    def buffer(self):
+        """
+Returns a context providing an empty buffer released afterwards.
+
+:return: (object) Context yielding a ByteBuffer instance
+:since:  v1.0.4
+        """
+
+        byte_buffer = self.acquire()
+
+        try: yield byte_buffer
+        finally: self.release(byte_buffer)
+    #
+
+    def _is_idle(self, byte_buffer):
+        """
+Returns true if the given buffer is already idle. The pool lock must be
+held.
+
+:param byte_buffer: ByteBuffer instance
+
+:return: (bool) True if idle
+:since:  v1.0.4
+        """
+
+        return (byte_buffer in self._buffers or byte_buffer in self._buffers_with_file)
+    #
+
+    def release(self, byte_buffer):
+        """
+Clears the given buffer and keeps it for reuse if the pool is not full.
+Buffers already idle are ignored.
+
+:param byte_buffer: ByteBuffer instance
+
+:since: v1.0.4
+        """
+
+        with self._lock:
+            is_idle = self._is_idle(byte_buffer)
+
+            is_pooled = ((not is_idle) and len(self._buffers) + len(self._buffers_with_file) < self.size)
+            is_file_retained = (is_pooled and len(self._buffers_with_file) < self.retained_files)
+        #
+
+        if (not is_idle):
+            is_file_retained = byte_buffer.clear(is_file_retained)
+
+            byte_buffer.file_mmap = self._file_mmap
+            byte_buffer.file_threshold = self._file_threshold
+            byte_buffer.set_digests(None)
+        #
+
+        if (is_pooled):
+            with self._lock:
+                if (not self._is_idle(byte_buffer)):
+                    if (len(self._buffers) + len(self._buffers_with_file) >= self.size): byte_buffer.close()
+                    elif (is_file_retained): self._buffers_with_file.append(byte_buffer)
+                    else: self._buffers.append(byte_buffer)
+                #
+            #
+        #
+    #
+#
@@ -0,0 +1,436 @@
+# -*- coding: utf-8 -*-
+
+"""
+direct Python Toolbox
+All-in-one toolbox to encapsulate Python runtime variants
+----------------------------------------------------------------------------
+(C) direct Netware Group - All rights reserved
+https://www.direct-netware.de/redirect?dpt;runtime
+
+This Source Code Form is subject to the terms of the Mozilla Public License,
+v. 2.0. If a copy of the MPL was not distributed with this file, You can
+obtain one at http://mozilla.org/MPL/2.0/.
+----------------------------------------------------------------------------
+https://www.direct-netware.de/redirect?licenses;mpl2
+----------------------------------------------------------------------------
+#echo(dptRuntimeVersion)#
+#echo(__FILEPATH__)#
+"""
+
+# pylint: disable=import-error,invalid-name
+
+from bisect import bisect_right
+from io import UnsupportedOperation
+import zlib
+
+try: import lzma
+except ImportError: lzma = None
+
+from .io_exception import IOException
+from .operation_not_supported_exception import OperationNotSupportedException
+from .value_exception import ValueException
+
+class CompressedSpillFile(object):
+    """
+"CompressedSpillFile" wraps a file and compresses data written to it in
+independent blocks. The uncompressed offset of each block is indexed to
+seek efficiently. Data is always appended.
+
+:author:     direct Netware Group et al.
+:copyright:  (C) direct Netware Group - All rights reserved
+:package:    dpt
+:subpackage: runtime
+:since:      v1.0.4
+:license:    https://www.direct-netware.de/redirect?licenses;mpl2
+             Mozilla Public License, v. 2.0
+    """
+
+    BLOCK_SIZE = 1048576
+    """
+Uncompressed size of a block
+    """
+
+    __slots__ = [ "__weakref__",
+                  "_block",
+                  "_block_index",
+                  "_blocks_size",
+                  "codec",
+                  "_compress",
+                  "_decompress",
+                  "file",
+                  "_file_offsets",
+                  "_file_size",
+                  "_offsets",
+                  "_position",
+                  "_size",
+                  "_write_buffer"
+                ]
+    """
+python.org: __slots__ reserves space for the declared variables and prevents
+the automatic creation of __dict__ and __weakref__ for each instance.
+    """
+
+    def __init__(self, _file, codec):
+        """
+Constructor __init__(CompressedSpillFile)
+
+:param _file: File object to write compressed data to
+:param codec: Compression codec name ("zlib" or "lzma")
+
+:since: v1.0.4
+        """
+
+        # global: lzma
+
+        if (not CompressedSpillFile.is_codec_supported(codec)): raise ValueException("Compression codec '{0}' is not supported".format(codec))
+
+        self._block = None
+        """
+Decompressed block cached
+        """
+        self._block_index = -1
+        """
+Index of the decompressed block cached
+        """
+        self._blocks_size = 0
+        """
+Uncompressed size in bytes written as blocks
+        """
+        self.codec = codec
+        """
+Compression codec name
+        """
+        self._compress = None
+        """
+Compression function
+        """
+        self._decompress = None
+        """
+Decompression function
+        """
+        self.file = _file
+        """
+Underlying file object
+        """
+        self._file_offsets = [ ]
+        """
+Compressed offset of each block
+        """
+        self._file_size = 0
+        """
+Compressed size in bytes written
+        """
+        self._offsets = [ ]
+        """
+Uncompressed offset of each block
+        """
+        self._position = 0
+        """
+Current uncompressed stream position
+        """
+        self._size = 0
+        """
+Uncompressed size in bytes written
+        """
+        self._write_buffer = bytearray()
+        """
+Uncompressed data not yet written as a block
+        """
+
+        if (codec == "lzma"):
+            self._compress = lambda data: lzma.compress(data, preset = 1)
+            self._decompress = lzma.decompress
+        else:
+            self._compress = lambda data: zlib.compress(data, 1)
+            self._decompress = zlib.decompress
+        #
+    #
+
+    def close(self):
+        """
+python.org: Flush and close this stream.
+
+:since: v1.0.4
+        """
+
+        self._block = None
+        self._write_buffer = bytearray()
+
+        self.file.close()
+    #
+
+    def fileno(self):
+        """
+python.org: Return the underlying file descriptor (an integer) of the
+stream if it exists.
+
+:since: v1.0.4
+        """
+
+        raise UnsupportedOperation("Compressed data is not accessible with a file descriptor")
+    #
+
+    def flush(self):
+        """
+python.org: Flush the write buffers of the stream if applicable.
+
+:since: v1.0.4
+        """
+
+        if (len(self._write_buffer) > 0):
+            self._write_block(self._write_buffer)
+            self._write_buffer = bytearray()
+        #
+
+        self.file.flush()
+    #
+
+    def _get_block(self, offset):
+        """
+Returns the uncompressed block containing the given offset.
+
+:param offset: Absolute uncompressed offset
+
+:return: (tuple) Block data and its absolute uncompressed offset
+:since:  v1.0.4
+        """
+
+        if (offset >= self._blocks_size): _return = ( self._write_buffer, self._blocks_size )
+        else:
+            index = bisect_right(self._offsets, offset) - 1
+
+            if (index != self._block_index):
+                file_offset = self._file_offsets[index]
+                file_offset_end = (self._file_size if (index + 1 == len(self._file_offsets)) else self._file_offsets[index + 1])
+
+                self.file.seek(file_offset)
+                self._block = self._decompress(self.file.read(file_offset_end - file_offset))
+                self._block_index = index
+            #
+
+            _return = ( self._block, self._offsets[index] )
+        #
+
+        return _return
+    #
+
+    def read(self, n = -1):
+        """
+python.org: Read up to n bytes from the object and return them.
+
+:param n: How many bytes to read from the current position (negative
+          means until EOF)
+
+:return: (bytes) Data
+:since:  v1.0.4
+        """
+
+        end = (self._size if (n is None or n < 0) else min(self._position + n, self._size))
+        data_list = [ ]
+
+        while (self._position < end):
+            block, block_offset = self._get_block(self._position)
+
+            data = block[self._position - block_offset:end - block_offset]
+            if (len(data) < 1): raise IOException("Compressed block does not contain the data expected")
+
+            data_list.append(bytes(data))
+
+            self._position += len(data)
+        #
+
+        return b"".join(data_list)
+    #
+
+    def readinto(self, b):
+        """
+python.org: Read bytes into a pre-allocated, writable bytes-like object b
+and return the number of bytes read.
+
+:param b: Writable bytes-like object
+
+:return: (int) Number of bytes read
+:since:  v1.0.4
+        """
+
+        view = memoryview(b)
+
+        data = self.read(len(view))
+        _return = len(data)
+
+        view[:_return] = data
+
+        return _return
+    #
+
+    def readline(self, limit = -1):
+        """
+python.org: Read and return one line from the stream.
+
+:param limit: If limit is specified, at most limit bytes will be read.
+
+:return: (bytes) Line read
+:since:  v1.0.4
+        """
+
+        end = (self._size if (limit is None or limit < 0) else min(self._position + limit, self._size))
+        data_list = [ ]
+
+        while (self._position < end):
+            block, block_offset = self._get_block(self._position)
+
+            line_end = block.find(b"\n", self._position - block_offset, end - block_offset)
+            line_end = (end - block_offset if (line_end < 0) else line_end + 1)
+
+            data = block[self._position - block_offset:line_end]
+            if (len(data) < 1): raise IOException("Compressed block does not contain the data expected")
+
+            data_list.append(bytes(data))
+
+            self._position += len(data)
+            if (data[-1:] == b"\n"): break
+        #
+
+        return b"".join(data_list)
+    #
+
+    def seek(self, offset, whence = 0):
+        """
+python.org: Change the stream position to the given byte offset.
+
+:param offset: Seek to the given offset
+:param whence: Seek relative to the start (0), current position (1) or end
+               (2)
+
+:return: (int) Return the new absolute position.
+:since:  v1.0.4
+        """
+
+        if (whence == 1): offset += self._position
+        elif (whence == 2): offset += self._size
+
+        if (offset < 0): raise ValueException("Negative seek position {0:d}".format(offset))
+
+        self._position = offset
+        return self._position
+    #
+
+    def tell(self):
+        """
+python.org: Return the current stream position.
+
+:return: (int) Stream position
+:since:  v1.0.4
+        """
+
+        return self._position
+    #
+
+    def truncate(self, size = None):
+        """
+python.org: Resize the stream to the given size in bytes. Only truncating
+all data is supported.
+
+:param size: Size in bytes (current position if None)
+
+:return: (int) New size
+:since:  v1.0.4
+        """
+
+        if (size is None): size = self._position
+        if (size != 0): raise OperationNotSupportedException()
+
+        self.file.seek(0)
+        self.file.truncate()
+
+        self._block = None
+        self._block_index = -1
+        self._blocks_size = 0
+        self._file_offsets = [ ]
+        self._file_size = 0
+        self._offsets = [ ]
+        self._size = 0
+        self._write_buffer = bytearray()
+
+        return 0
+    #
+
+    def write(self, b):
+        """
+python.org: Write the given bytes-like object, b, and return the number of
+bytes written.
+
+:param b: Bytes data
+
+:return: (int) Number of bytes written
+:since:  v1.0.4
+        """
+
+        view = memoryview(b)
+        _return = len(view)
+
+        offset = 0
+
+        if (len(self._write_buffer) > 0):
+            offset = min(CompressedSpillFile.BLOCK_SIZE - len(self._write_buffer), _return)
+            self._write_buffer += view[:offset]
+
+            if (len(self._write_buffer) >= CompressedSpillFile.BLOCK_SIZE):
+                self._write_block(self._write_buffer)
+                self._write_buffer = bytearray()
+            #
+        #
+
+        while (_return - offset >= CompressedSpillFile.BLOCK_SIZE):
+            self._write_block(view[offset:offset + CompressedSpillFile.BLOCK_SIZE])
+            offset += CompressedSpillFile.BLOCK_SIZE
+        #
+
+        if (offset < _return): self._write_buffer += view[offset:]
+
+        self._size += _return
+        self._position = self._size
+
+        return _return
+    #
+
+    def _write_block(self, data):
+        """
+Compresses and writes the given data as a block.
+
+:param data: Uncompressed block data
+
+:since: v1.0.4
+        """
+
+        self._file_offsets.append(self._file_size)
+        self._offsets.append(self._blocks_size)
+
+        self._blocks_size += len(data)
+
+        # Python 2 codecs reject bytearray and memoryview input while
+        # "bytes(memoryview)" returns its representation there.
+        data = self._compress(data.tobytes() if (isinstance(data, memoryview)) else bytes(data))
+
+        self.file.seek(self._file_size)
+        self.file.write(data)
+
+        self._file_size += len(data)
+    #
+
+    @staticmethod
+    def is_codec_supported(codec):
+        """
+Returns true if the given compression codec is supported.
+
+:param codec: Compression codec name
+
+:return: (bool) True if supported
+:since:  v1.0.4
+        """
+
+        # global: lzma
+
+        return (codec == "zlib" or (codec == "lzma" and lzma is not None))
+    #
+#
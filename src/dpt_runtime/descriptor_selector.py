@@ -39,7 +39,7 @@ the same time.
 Additional poll signals to be handled.
     """
 
-    __slots__ = [ "_poller", "_selectors", "_selectors_polled" ]
+    __slots__ = [ "_event_masks", "_events_polled", "_poller", "_selectors_polled" ]
     """
 python.org: __slots__ reserves space for the declared variables and prevents
 the automatic creation of __dict__ and __weakref__ for each instance.
@@ -56,22 +56,35 @@ Constructor __init__(DescriptorSelector)
 :since: v1.0.0
         """
 
-        if (rlist is None): rlist = [ ]
-        if (wlist is None): wlist = [ ]
-        if (xlist is None): xlist = [ ]
-
-        self._poller = (select.poll() if (hasattr(select, "poll")) else None)
+        self._event_masks = { }
         """
-Poll object if supported
+Dictionary of descriptors and their event mask
         """
-        self._selectors = ( rlist, wlist, xlist )
+        self._events_polled = None
+        """
+Events the descriptors are registered for polling with; None if not
+registered
+        """
+        self._poller = (select.poll() if (hasattr(select, "poll")) else None)
         """
-List of descriptors
+Poll object if supported
         """
-        self._selectors_polled = ( 0, 0, 0 )
+        self._selectors_polled = { }
         """
-Number of descriptors polled
+Dictionary of descriptors registered for polling and their event mask
         """
+
+        if (rlist is not None):
+            for descriptor in rlist: self.register(descriptor)
+        #
+
+        if (wlist is not None):
+            for descriptor in wlist: self.register(descriptor, False, True)
+        #
+
+        if (xlist is not None):
+            for descriptor in xlist: self.register(descriptor, False, is_exceptional = True)
+        #
     #
 
     def __del__(self):
@@ -84,27 +97,91 @@ Destructor __del__(DescriptorSelector)
         self._unregister_from_polling()
     #
 
+    def register(self, descriptor, is_readable = True, is_writable = False, is_exceptional = False):
+        """
+Adds the given descriptor to the selectors. It is registered for polling
+immediately if descriptors have been kept registered by the last call of
+"select()".
+
+:param descriptor: Descriptor to add
+:param is_readable: True to select the descriptor if it can be read from
+:param is_writable: True to select the descriptor if it can be written to
+:param is_exceptional: True to select the descriptor for exceptional
+                       conditions
+
+:since: v1.0.4
+        """
+
+        event_mask = self._event_masks.get(descriptor, 0)
+
+        if (is_readable): event_mask |= select.POLLIN
+        if (is_writable): event_mask |= select.POLLOUT
+        if (is_exceptional): event_mask |= select.POLLPRI
+
+        self._event_masks[descriptor] = event_mask
+        if (self._events_polled is not None): self._register_descriptor_for_polling(descriptor, event_mask)
+    #
+
+    def _register_descriptor_for_polling(self, descriptor, event_mask):
+        """
+Registers the given descriptor for polling with the events selected.
+
+:param descriptor: Descriptor to register
+:param event_mask: Event mask of the descriptor
+
+:since: v1.0.4
+        """
+
+        event_mask &= self._events_polled
+
+        if (event_mask != self._selectors_polled.get(descriptor, 0)):
+            if (event_mask == 0):
+                self._poller.unregister(descriptor)
+                del self._selectors_polled[descriptor]
+            else:
+                self._poller.register(descriptor, event_mask | DescriptorSelector.LOST_BITS)
+                self._selectors_polled[descriptor] = event_mask
+            #
+        #
+    #
+
     def select(self, timeout = -1, unregister = True, is_readable = True, is_writable = True):
         """
-Selects descriptors matching expected events.
+Selects descriptors matching expected events. Descriptors kept registered
+for polling are only registered again if different events are selected.
 
 :return: (tuple) Tuple of descriptors matching expected events
 :since:  v1.0.0
         """
 
-        rlist = (self._selectors[0] if (is_readable) else [ ])
-        wlist = (self._selectors[1] if (is_writable) else [ ])
-        xlist = self._selectors[2]
+        events = select.POLLPRI
+        if (is_readable): events |= select.POLLIN
+        if (is_writable): events |= select.POLLOUT
+
+        if (self._poller is None):
+            dlists = ( [ ], [ ], [ ] )
+
+            for descriptor, event_mask in self._event_masks.items():
+                event_mask &= events
+
+                if (event_mask & select.POLLIN): dlists[0].append(descriptor)
+                if (event_mask & select.POLLOUT): dlists[1].append(descriptor)
+                if (event_mask & select.POLLPRI): dlists[2].append(descriptor)
+            #
 
-        if (self._poller is None): _return = select.select(rlist, wlist, xlist, timeout)
+            _return = select.select(dlists[0], dlists[1], dlists[2], (None if (timeout < 0) else timeout))
         else:
-            self._register_for_polling(rlist, wlist, xlist)
+            if (self._events_polled != events): self._register_for_polling(events)
 
             waiting_list = (self._poller.poll() if (timeout < 0) else self._poller.poll(timeout * 1000))
             _return = ( [ ], [ ], [ ] )
 
             for descriptor_data in waiting_list:
-                if (descriptor_data[1] & select.POLLIN): _return[0].append(descriptor_data[0])
+                if (descriptor_data[1] & select.POLLIN
+                    or (descriptor_data[1] & DescriptorSelector.LOST_BITS
+                        and self._selectors_polled.get(descriptor_data[0], 0) & select.POLLIN
+                       )
+                   ): _return[0].append(descriptor_data[0])
                 if (descriptor_data[1] & select.POLLOUT): _return[1].append(descriptor_data[0])
                 if (descriptor_data[1] & select.POLLPRI): _return[2].append(descriptor_data[0])
             #
@@ -115,42 +192,50 @@ Selects descriptors matching expected events.
         return _return
     #
 
-    def _register_for_polling(self, rlist, wlist, xlist):
+    def _register_for_polling(self, events):
         """
-Destructor __del__(Abstract)
+Registers all descriptors for polling with the given events.
+
+:param events: Events to select
 
 :since: v1.0.0
         """
 
-        if (self._selectors_polled[0] != len(rlist)):
-            if (self._selectors_polled[0] > 0): self._unregister_from_polling(rlist)
-            for descriptor in rlist: self._poller.register(descriptor, select.POLLIN | DescriptorSelector.LOST_BITS)
-        #
+        self._events_polled = events
 
-        if (self._selectors_polled[1] != len(wlist)):
-            if (self._selectors_polled[1] > 0): self._unregister_from_polling(wlist)
-            for descriptor in wlist: self._poller.register(descriptor, select.POLLOUT | DescriptorSelector.LOST_BITS)
+        for descriptor, event_mask in self._event_masks.items():
+            self._register_descriptor_for_polling(descriptor, event_mask)
         #
+    #
+
+    def unregister(self, descriptor):
+        """
+Removes the given descriptor from the selectors. It is unregistered from
+polling immediately.
+
+:param descriptor: Descriptor to remove
 
-        if (self._selectors_polled[2] != len(xlist)):
-            if (self._selectors_polled[2] > 0): self._unregister_from_polling(xlist)
-            for descriptor in xlist: self._poller.register(descriptor, select.POLLPRI | DescriptorSelector.LOST_BITS)
+:since: v1.0.4
+        """
+
+        self._event_masks.pop(descriptor, None)
+
+        if (descriptor in self._selectors_polled):
+            self._poller.unregister(descriptor)
+            del self._selectors_polled[descriptor]
         #
     #
 
-    def _unregister_from_polling(self, dlist = None):
+    def _unregister_from_polling(self):
         """
-Destructor __del__(Abstract)
+Unregisters all descriptors from polling.
 
 :since: v1.0.0
         """
 
-        if (dlist is None):
-            if (self._selectors_polled[0] > 0): self._unregister_from_polling(self._selectors[0])
-            if (self._selectors_polled[1] > 0): self._unregister_from_polling(self._selectors[1])
-            if (self._selectors_polled[2] > 0): self._unregister_from_polling(self._selectors[2])
-        else:
-            for descriptor in dlist: self._poller.unregister(descriptor)
-        #
+        for descriptor in self._selectors_polled: self._poller.unregister(descriptor)
+
+        self._events_polled = None
+        self._selectors_polled = { }
     #
 #
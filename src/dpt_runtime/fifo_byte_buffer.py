@@ -0,0 +1,407 @@
+# -*- coding: utf-8 -*-
+
+"""
+direct Python Toolbox
+All-in-one toolbox to encapsulate Python runtime variants
+----------------------------------------------------------------------------
+(C) direct Netware Group - All rights reserved
+https://www.direct-netware.de/redirect?dpt;runtime
+
+This Source Code Form is subject to the terms of the Mozilla Public License,
+v. 2.0. If a copy of the MPL was not distributed with this file, You can
+obtain one at http://mozilla.org/MPL/2.0/.
+----------------------------------------------------------------------------
+https://www.direct-netware.de/redirect?licenses;mpl2
+----------------------------------------------------------------------------
+#echo(dptRuntimeVersion)#
+#echo(__FILEPATH__)#
+"""
+
+from .binary import Binary
+from .byte_buffer import ByteBuffer
+from .operation_not_supported_exception import OperationNotSupportedException
+from .segmented_buffer import SegmentedBuffer
+
+class FifoByteBuffer(ByteBuffer):
+    """
+"FifoByteBuffer" is a "ByteBuffer" used as a first-in-first-out pipe. Data
+can be written and read interleaved. Data read is released and the external
+file is given up again as soon as the data not yet read fits into memory.
+The external file is compacted if more data has been read from it than is
+left.
+Note that this class is not thread safe.
+
+:author:     direct Netware Group et al.
+:copyright:  (C) direct Netware Group - All rights reserved
+:package:    dpt
+:subpackage: runtime
+:since:      v1.0.4
+:license:    https://www.direct-netware.de/redirect?licenses;mpl2
+             Mozilla Public License, v. 2.0
+    """
+
+    COMPACT_CHUNK_SIZE = 65536
+    """
+Size of chunks copied while compacting the external file
+    """
+
+    __slots__ = [ "_file_read_offset", "_file_write_offset", "_is_file_written", "read_size" ]
+    """
+python.org: __slots__ reserves space for the declared variables and prevents
+the automatic creation of __dict__ and __weakref__ for each instance.
+    """
+
+    def __init__(self):
+        """
+Constructor __init__(FifoByteBuffer)
+
+:since: v1.0.4
+        """
+
+        ByteBuffer.__init__(self)
+
+        self._file_read_offset = 0
+        """
+External file offset to read from
+        """
+        self._file_write_offset = 0
+        """
+External file offset to write to
+        """
+        self._is_file_written = False
+        """
+True if the external file position is at the write offset
+        """
+        self.read_size = 0
+        """
+Buffer size in bytes read
+        """
+    #
+
+    @property
+    def available(self):
+        """
+Returns the size of the data not yet read.
+
+:return: (int) Size available in bytes
+:since:  v1.0.4
+        """
+
+        return self.buffer_size - self.read_size
+    #
+
+    @property
+    def is_writable(self):
+        """
+Returns true if the buffer is writable.
+
+:return: (bool) True if writable
+:since:  v1.0.4
+        """
+
+        return True
+    #
+
+    def clear(self, is_file_retained = False):
+        """
+Clears all data.
+
+:param is_file_retained: True to truncate and retain the external file for
+                         reuse
+
+:return: (bool) True if an external file has been retained
+:since:  v1.0.4
+        """
+
+        self._file_read_offset = 0
+        self._file_write_offset = 0
+        self._is_file_written = False
+        self.read_size = 0
+
+        return ByteBuffer.clear(self, is_file_retained)
+    #
+
+    def _compact_buffer_file(self):
+        """
+Moves the data not yet read to a new or the retained external file. The
+file used before is truncated and retained for reuse.
+
+:since: v1.0.4
+        """
+
+        buffer_file = self._get_new_buffer_file()
+
+        self.buffer_file.seek(self._file_read_offset)
+        data = self.buffer_file.read(FifoByteBuffer.COMPACT_CHUNK_SIZE)
+
+        while (len(data) > 0):
+            buffer_file.write(data)
+            data = self.buffer_file.read(FifoByteBuffer.COMPACT_CHUNK_SIZE)
+        #
+
+        self.buffer_file.seek(0)
+        self.buffer_file.truncate()
+
+        self._buffer_file_spare = self.buffer_file
+
+        self.buffer_file = buffer_file
+        self._file_read_offset = 0
+        self._file_write_offset = self.available
+        self._is_file_written = True
+    #
+
+    def get_cursor(self, position = 0):
+        """
+Read cursors are not supported for FIFO buffers.
+
+:param position: Initial cursor position
+
+:since: v1.0.4
+        """
+
+        raise OperationNotSupportedException()
+    #
+
+    def getbuffer(self):
+        """
+A view over the buffer data is not supported for FIFO buffers.
+
+:since: v1.0.4
+        """
+
+        raise OperationNotSupportedException()
+    #
+
+    def getbuffers(self):
+        """
+Views over the buffer data are not supported for FIFO buffers.
+
+:since: v1.0.4
+        """
+
+        raise OperationNotSupportedException()
+    #
+
+    def _read(self, method, *args):
+        """
+Calls the given read method of the buffer object in use and releases the
+data read.
+
+:param method: Unbound read method name
+:param args: Read method arguments
+
+:return: (mixed) Read method result
+:since:  v1.0.4
+        """
+
+        handle = self.handle
+
+        if (self.buffer_file is not None and self._is_file_written):
+            handle.seek(self._file_read_offset)
+            self._is_file_written = False
+        #
+
+        position = handle.tell()
+        _return = getattr(handle, method)(*args)
+        self.read_size += handle.tell() - position
+
+        if (self.buffer_file is None):
+            self.buffer.release_read_segments()
+            if (self.buffer.size < 1): self._release_memory_reserved()
+        else:
+            self._file_read_offset = handle.tell()
+
+            if (self.available <= self.file_threshold // 2): self._read_file_to_buffer()
+            elif (self._file_read_offset > max(self.file_threshold, self.available)): self._compact_buffer_file()
+        #
+
+        return _return
+    #
+
+    def read(self, n = 0):
+        """
+python.org: Read up to n bytes from the object and return them.
+
+:param n: How many bytes to read (0 means all data available)
+
+:return: (bytes) Data
+:since:  v1.0.4
+        """
+
+        return self._read("read", (-1 if (n < 1) else n))
+    #
+
+    def _read_file_to_buffer(self):
+        """
+Moves the data not yet read from the external file back into memory. The
+truncated file is retained for reuse.
+
+:since: v1.0.4
+        """
+
+        buffer = SegmentedBuffer()
+        buffer.write(self.buffer_file.read())
+
+        self.buffer_file.seek(0)
+        self.buffer_file.truncate()
+
+        self._buffer_file_spare = self.buffer_file
+
+        self.buffer = buffer
+        self.buffer_file = None
+        self._file_read_offset = 0
+        self._file_write_offset = 0
+    #
+
+    def readinto(self, b):
+        """
+python.org: Read bytes into a pre-allocated, writable bytes-like object b
+and return the number of bytes read.
+
+:param b: Writable bytes-like object
+
+:return: (int) Number of bytes read
+:since:  v1.0.4
+        """
+
+        return self._read("readinto", b)
+    #
+
+    def readline(self, limit = -1):
+        """
+python.org: Read and return one line from the stream.
+
+:param limit: If limit is specified, at most limit bytes will be read.
+
+:return: (bytes) Line read
+:since:  v1.0.4
+        """
+
+        return self._read("readline", limit)
+    #
+
+    def seek(self, offset):
+        """
+Seeking is not supported for FIFO buffers.
+
+:param offset: Seek to the given offset
+
+:since: v1.0.4
+        """
+
+        raise OperationNotSupportedException()
+    #
+
+    def tell(self):
+        """
+Returns the number of bytes read.
+
+:return: (int) Stream position
+:since:  v1.0.4
+        """
+
+        return self.read_size
+    #
+
+    def write(self, b):
+        """
+python.org: Write the given bytes or bytearray object, b, to the underlying
+raw stream and return the number of bytes written.
+
+:param b: Bytes data
+
+:return: (int) Number of bytes written
+:since:  v1.0.4
+        """
+
+        b = Binary.bytes(b)
+
+        if (self.buffer_file is None):
+            _return = self.buffer.write(b)
+            if (self._is_buffer_file_required(self.buffer.size - self.buffer.tell())): self._write_buffer_to_file()
+        else:
+            if (not self._is_file_written):
+                self.buffer_file.seek(self._file_write_offset)
+                self._is_file_written = True
+            #
+
+            _return = self._write_buffer_file(b)
+            self._file_write_offset += _return
+        #
+
+        self.buffer_size += _return
+
+        return _return
+    #
+
+    def _write_buffer_file_from_fd(self, fd, size):
+        """
+Copies up to size bytes from the given file descriptor to the external file
+at the write offset.
+
+:param fd: Source file descriptor
+:param size: How many bytes to copy at most
+
+:return: (int) Number of bytes copied; None if not supported
+:since:  v1.0.4
+        """
+
+        if (not self._is_file_written):
+            self.buffer_file.seek(self._file_write_offset)
+            self._is_file_written = True
+        #
+
+        _return = ByteBuffer._write_buffer_file_from_fd(self, fd, size)
+        if (_return is not None): self._file_write_offset += _return
+
+        return _return
+    #
+
+    def _write_buffer_to_file(self):
+        """
+Moves the data not yet read to an external file.
+
+:since: v1.0.4
+        """
+
+        ByteBuffer._write_buffer_to_file(self)
+
+        self._file_read_offset = 0
+        self._file_write_offset = self.buffer_file.tell()
+        self._is_file_written = True
+    #
+
+    def writev(self, buffers):
+        """
+Writes the given list of bytes data at once. The threshold is only checked
+once and data is written to the external file with one system call if
+supported.
+
+:param buffers: Iterable of bytes data
+
+:return: (int) Number of bytes written
+:since:  v1.0.4
+        """
+
+        buffers = [ Binary.bytes(b) for b in buffers ]
+
+        if (self.buffer_file is None):
+            _return = 0
+            for b in buffers: _return += self.buffer.write(b)
+
+            if (self._is_buffer_file_required(self.buffer.size - self.buffer.tell())): self._write_buffer_to_file()
+        else:
+            if (not self._is_file_written):
+                self.buffer_file.seek(self._file_write_offset)
+                self._is_file_written = True
+            #
+
+            _return = self._writev_buffer_file(buffers)
+            self._file_write_offset += _return
+        #
+
+        self.buffer_size += _return
+
+        return _return
+    #
+#
@@ -0,0 +1,146 @@
+# -*- coding: utf-8 -*-
+
+"""
+direct Python Toolbox
+All-in-one toolbox to encapsulate Python runtime variants
+----------------------------------------------------------------------------
+(C) direct Netware Group - All rights reserved
+https://www.direct-netware.de/redirect?dpt;runtime
+
+This Source Code Form is subject to the terms of the Mozilla Public License,
+v. 2.0. If a copy of the MPL was not distributed with this file, You can
+obtain one at http://mozilla.org/MPL/2.0/.
+----------------------------------------------------------------------------
+https://www.direct-netware.de/redirect?licenses;mpl2
+----------------------------------------------------------------------------
+#echo(dptRuntimeVersion)#
+#echo(__FILEPATH__)#
+"""
+
+from dpt_settings import Settings
+
+from .io_exception import IOException
+from .iterator import Iterator
+from .value_exception import ValueException
+
+class FrameDecoder(Iterator):
+    """
+"FrameDecoder" iterates over messages received with a "SocketReader".
+Messages are either prefixed with their length or terminated by a
+delimiter. The read-ahead buffer of the reader is used to decode many small
+frames from one receive call.
+
+:author:     direct Netware Group et al.
+:copyright:  (C) direct Netware Group - All rights reserved
+:package:    dpt
+:subpackage: runtime
+:since:      v1.0.4
+:license:    https://www.direct-netware.de/redirect?licenses;mpl2
+             Mozilla Public License, v. 2.0
+    """
+
+    __slots__ = [ "byteorder", "delimiter", "max_frame_size", "prefix_size", "socket_reader" ]
+    """
+python.org: __slots__ reserves space for the declared variables and prevents
+the automatic creation of __dict__ and __weakref__ for each instance.
+    """
+
+    def __init__(self, socket_reader, prefix_size = 4, byteorder = "big", delimiter = None, max_frame_size = None):
+        """
+Constructor __init__(FrameDecoder)
+
+:param socket_reader: SocketReader instance to read frames from
+:param prefix_size: Size of the length prefix in bytes
+:param byteorder: Byte order of the length prefix ("big" or "little")
+:param delimiter: Delimiter terminating each frame instead of a length
+                  prefix
+:param max_frame_size: Maximum frame size in bytes
+
+:since: v1.0.4
+        """
+
+        if (byteorder not in ( "big", "little" )): raise ValueException("Byte order given is invalid")
+        if (delimiter is None and prefix_size < 1): raise ValueException("Prefix size given is invalid")
+
+        self.byteorder = byteorder
+        """
+Byte order of the length prefix
+        """
+        self.delimiter = delimiter
+        """
+Delimiter terminating each frame
+        """
+        self.max_frame_size = max_frame_size
+        """
+Maximum frame size in bytes
+        """
+        self.prefix_size = prefix_size
+        """
+Size of the length prefix in bytes
+        """
+        self.socket_reader = socket_reader
+        """
+SocketReader instance to read frames from
+        """
+
+        if (self.max_frame_size is None):
+            self.max_frame_size = int(Settings.get("dpt_runtime_frame_decoder_max_frame_size", 16777216))
+        #
+    #
+
+    def __next__(self):
+        """
+python.org: Return the next item from the container.
+
+:return: (bytes) Frame data without its length prefix or delimiter
+:since:  v1.0.4
+        """
+
+        return (self._read_length_prefixed_frame() if (self.delimiter is None) else self._read_delimited_frame())
+    #
+
+    def _read_delimited_frame(self):
+        """
+Reads the next frame terminated by the delimiter.
+
+:return: (bytes) Frame data
+:since:  v1.0.4
+        """
+
+        data = self.socket_reader.read_until(self.delimiter, self.max_frame_size + len(self.delimiter))
+
+        if (len(data) < 1): raise StopIteration()
+
+        if (not data.endswith(self.delimiter)):
+            if (len(data) > self.max_frame_size): raise ValueException("Frame exceeds the maximum size")
+            raise IOException("Socket reached EOF within a frame")
+        #
+
+        return data[:-len(self.delimiter)]
+    #
+
+    def _read_length_prefixed_frame(self):
+        """
+Reads the next frame prefixed with its length.
+
+:return: (bytes) Frame data
+:since:  v1.0.4
+        """
+
+        prefix = self.socket_reader.peek(self.prefix_size)
+
+        if (len(prefix) < 1): raise StopIteration()
+        if (len(prefix) < self.prefix_size): raise IOException("Socket reached EOF within a frame")
+
+        prefix_bytes = bytearray(prefix)
+        if (self.byteorder == "little"): prefix_bytes.reverse()
+
+        frame_size = 0
+        for value in prefix_bytes: frame_size = (frame_size << 8) | value
+
+        if (frame_size > self.max_frame_size): raise ValueException("Frame exceeds the maximum size")
+
+        self.socket_reader.readexactly(self.prefix_size)
+        return self.socket_reader.readexactly(frame_size)
+    #
+#
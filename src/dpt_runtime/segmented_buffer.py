@@ -0,0 +1,433 @@
+# -*- coding: utf-8 -*-
+
+"""
+direct Python Toolbox
+All-in-one toolbox to encapsulate Python runtime variants
+----------------------------------------------------------------------------
+(C) direct Netware Group - All rights reserved
+https://www.direct-netware.de/redirect?dpt;runtime
+
+This Source Code Form is subject to the terms of the Mozilla Public License,
+v. 2.0. If a copy of the MPL was not distributed with this file, You can
+obtain one at http://mozilla.org/MPL/2.0/.
+----------------------------------------------------------------------------
+https://www.direct-netware.de/redirect?licenses;mpl2
+----------------------------------------------------------------------------
+#echo(dptRuntimeVersion)#
+#echo(__FILEPATH__)#
+"""
+
+from bisect import bisect_right
+
+from .value_exception import ValueException
+
+class SegmentedBuffer(object):
+    """
+"SegmentedBuffer" is a file-like in-memory byte buffer keeping written data
+as a list of immutable segments. Appending data never reallocates or copies
+data already written. Small writes are coalesced before being added as a
+segment.
+
+:author:     direct Netware Group et al.
+:copyright:  (C) direct Netware Group - All rights reserved
+:package:    dpt
+:subpackage: runtime
+:since:      v1.0.4
+:license:    https://www.direct-netware.de/redirect?licenses;mpl2
+             Mozilla Public License, v. 2.0
+    """
+
+    SEGMENT_COALESCE_SIZE = 4096
+    """
+Writes smaller than this size are coalesced with adjacent ones
+    """
+    SEGMENT_SIZE = 65536
+    """
+Size of coalesced segments
+    """
+
+    __slots__ = [ "__weakref__", "_offsets", "_position", "_segments", "_size", "_tail" ]
+    """
+python.org: __slots__ reserves space for the declared variables and prevents
+the automatic creation of __dict__ and __weakref__ for each instance.
+    """
+
+    def __init__(self):
+        """
+Constructor __init__(SegmentedBuffer)
+
+:since: v1.0.4
+        """
+
+        self._offsets = [ ]
+        """
+Absolute offset of each segment
+        """
+        self._position = 0
+        """
+Current stream position
+        """
+        self._segments = [ ]
+        """
+List of immutable segments
+        """
+        self._size = 0
+        """
+Buffer size in bytes written
+        """
+        self._tail = bytearray()
+        """
+Coalesced small writes not yet added as a segment
+        """
+    #
+
+    @property
+    def segments(self):
+        """
+Returns the list of segments currently held.
+
+:return: (list) List of bytes segments
+:since:  v1.0.4
+        """
+
+        self._freeze_tail()
+        return self._segments
+    #
+
+    @property
+    def size(self):
+        """
+Returns the current size of the buffer.
+
+:return: (int) Size written in bytes
+:since:  v1.0.4
+        """
+
+        return self._size
+    #
+
+    def close(self):
+        """
+python.org: Flush and close this stream.
+
+:since: v1.0.4
+        """
+
+        self._offsets = [ ]
+        self._position = 0
+        self._segments = [ ]
+        self._size = 0
+        self._tail = bytearray()
+    #
+
+    def _freeze_tail(self):
+        """
+Adds coalesced small writes as an immutable segment.
+
+:since: v1.0.4
+        """
+
+        if (len(self._tail) > 0):
+            self._offsets.append(self._size - len(self._tail))
+            self._segments.append(bytes(self._tail))
+
+            self._tail = bytearray()
+        #
+    #
+
+    def _get_segment_index(self, offset):
+        """
+Returns the index of the segment containing the given offset.
+
+:param offset: Absolute offset
+
+:return: (int) Segment index
+:since:  v1.0.4
+        """
+
+        return bisect_right(self._offsets, offset) - 1
+    #
+
+    def getbuffer(self):
+        """
+python.org: Return a readable view over the contents of the buffer.
+
+Multiple segments are joined into a single one first which copies the data
+once. Use "getbuffers()" to get views without copying.
+
+:return: (object) Read-only memoryview instance
+:since:  v1.0.4
+        """
+
+        self._freeze_tail()
+
+        if (len(self._segments) > 1):
+            self._offsets = [ 0 ]
+            self._segments = [ b"".join(self._segments) ]
+        #
+
+        return memoryview(self._segments[0] if (len(self._segments) > 0) else b"")
+    #
+
+    def getbuffers(self):
+        """
+Returns a list of read-only views over each segment in order without
+copying them.
+
+:return: (list) List of memoryview instances
+:since:  v1.0.4
+        """
+
+        self._freeze_tail()
+        return [ memoryview(segment) for segment in self._segments ]
+    #
+
+    def pop_segments(self):
+        """
+Removes all segments from the buffer and yields the data from the current
+position on in order. Each segment is released as soon as it has been
+consumed.
+
+:return: (object) Segment generator
+:since:  v1.0.4
+        """
+
+        self._freeze_tail()
+
+        position = self._position
+        segments = self._segments
+
+        if (position > 0 and position < self._size):
+            index = self._get_segment_index(position)
+            offset = self._offsets[index]
+
+            del segments[:index]
+            if (position > offset): segments[0] = memoryview(segments[0])[position - offset:]
+        elif (position > 0): segments = [ ]
+
+        segments.reverse()
+
+        self.close()
+
+        while (len(segments) > 0): yield segments.pop()
+    #
+
+    def read(self, n = -1):
+        """
+python.org: Read up to n bytes from the object and return them.
+
+:param n: How many bytes to read from the current position (negative
+          means until EOF)
+
+:return: (bytes) Data
+:since:  v1.0.4
+        """
+
+        if (n is None or n < 0): n = self._size - self._position
+
+        _return = self.read_at(self._position, n)
+        self._position += len(_return)
+
+        return _return
+    #
+
+    def read_at(self, offset, n):
+        """
+Read up to n bytes from the given offset without changing the stream
+position.
+
+:param offset: Absolute offset to read from
+:param n: How many bytes to read
+
+:return: (bytes) Data
+:since:  v1.0.4
+        """
+
+        self._freeze_tail()
+
+        end = min(offset + n, self._size)
+        if (offset >= end): return b""
+
+        index = self._get_segment_index(offset)
+        segment = self._segments[index]
+        segment_offset = offset - self._offsets[index]
+
+        if (segment_offset + end - offset <= len(segment)):
+            _return = (segment
+                       if (segment_offset == 0 and end - offset == len(segment)) else
+                       segment[segment_offset:segment_offset + end - offset]
+                      )
+        else:
+            data_list = [ segment[segment_offset:] ]
+            offset += len(segment) - segment_offset
+
+            while (offset < end):
+                index += 1
+                segment = self._segments[index]
+
+                data_list.append(segment if (offset + len(segment) <= end) else segment[:end - offset])
+                offset += len(segment)
+            #
+
+            _return = b"".join(data_list)
+        #
+
+        return _return
+    #
+
+    def readinto(self, b):
+        """
+python.org: Read bytes into a pre-allocated, writable bytes-like object b
+and return the number of bytes read.
+
+:param b: Writable bytes-like object
+
+:return: (int) Number of bytes read
+:since:  v1.0.4
+        """
+
+        self._freeze_tail()
+
+        view = memoryview(b)
+        end = min(self._position + len(view), self._size)
+        _return = 0
+
+        if (self._position < end):
+            index = self._get_segment_index(self._position)
+            segment_offset = self._position - self._offsets[index]
+
+            while (self._position < end):
+                segment = self._segments[index]
+                size = min(len(segment) - segment_offset, end - self._position)
+
+                view[_return:_return + size] = memoryview(segment)[segment_offset:segment_offset + size]
+
+                _return += size
+                self._position += size
+
+                index += 1
+                segment_offset = 0
+            #
+        #
+
+        return _return
+    #
+
+    def readline(self, limit = -1):
+        """
+python.org: Read and return one line from the stream.
+
+:param limit: If limit is specified, at most limit bytes will be read.
+
+:return: (bytes) Line read
+:since:  v1.0.4
+        """
+
+        self._freeze_tail()
+
+        end = (self._size if (limit is None or limit < 0) else min(self._position + limit, self._size))
+        line_end = end
+
+        if (self._position < end):
+            index = self._get_segment_index(self._position)
+            offset = self._offsets[index]
+
+            while (offset < end):
+                segment = self._segments[index]
+                position = segment.find(b"\n", max(self._position - offset, 0), end - offset)
+
+                if (position > -1):
+                    line_end = offset + position + 1
+                    break
+                #
+
+                offset += len(segment)
+                index += 1
+            #
+        #
+
+        return self.read(line_end - self._position)
+    #
+
+    def release_read_segments(self):
+        """
+Releases all segments read completely.
+
+:since: v1.0.4
+        """
+
+        if (self._position >= self._size): self.close()
+        else:
+            index = self._get_segment_index(self._position)
+
+            if (index > 0):
+                del self._offsets[:index]
+                del self._segments[:index]
+            #
+        #
+    #
+
+    def seek(self, offset, whence = 0):
+        """
+python.org: Change the stream position to the given byte offset.
+
+:param offset: Seek to the given offset
+:param whence: Seek relative to the start (0), current position (1) or end
+               (2)
+
+:return: (int) Return the new absolute position.
+:since:  v1.0.4
+        """
+
+        if (whence == 1): offset += self._position
+        elif (whence == 2): offset += self._size
+
+        if (offset < 0): raise ValueException("Negative seek position {0:d}".format(offset))
+
+        self._freeze_tail()
+        self._position = offset
+        return self._position
+    #
+
+    def tell(self):
+        """
+python.org: Return the current stream position.
+
+:return: (int) Stream position
+:since:  v1.0.4
+        """
+
+        return self._position
+    #
+
+    def write(self, b):
+        """
+python.org: Write the given bytes-like object, b, and return the number of
+bytes written. Data is always appended to the end of the buffer.
+
+:param b: Bytes data
+
+:return: (int) Number of bytes written
+:since:  v1.0.4
+        """
+
+        if (isinstance(b, memoryview)): b = b.tobytes()
+        _return = len(b)
+
+        if (_return < SegmentedBuffer.SEGMENT_COALESCE_SIZE):
+            self._tail += b
+            self._size += _return
+
+            if (len(self._tail) >= SegmentedBuffer.SEGMENT_SIZE): self._freeze_tail()
+        else:
+            self._freeze_tail()
+
+            self._offsets.append(self._size)
+            self._segments.append(b if (isinstance(b, bytes)) else bytes(b))
+
+            self._size += _return
+        #
+
+        return _return
+    #
+#
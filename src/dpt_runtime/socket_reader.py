@@ -19,6 +19,9 @@ https://www.direct-netware.de/redirect?licenses;mpl2
 
 from time import time
 
+try: from ssl import SSLWantReadError
+except ImportError: SSLWantReadError = ( )
+
 from dpt_settings import Settings
 
 from .descriptor_selector import DescriptorSelector
@@ -27,7 +30,8 @@ from .io_exception import IOException
 class SocketReader(object):
     """
 "SocketReader" provides a "recv()" method implementing time limited read
-operations from blocking and non-blocking sockets.
+operations from blocking and non-blocking sockets. Delimited data is read
+with a read-ahead buffer consumed by all read methods.
 
 :author:     direct Netware Group et al.
 :copyright:  direct Netware Group - All rights reserved
@@ -38,7 +42,20 @@ operations from blocking and non-blocking sockets.
              Mozilla Public License, v. 2.0
     """
 
-    __slots__ = [ "__weakref__", "socket", "_timeout" ]
+    READ_AHEAD_SIZE = 65536
+    """
+Size of each chunk received for the read-ahead buffer
+    """
+
+    __slots__ = [ "__weakref__",
+                  "_is_eof",
+                  "_read_buffer",
+                  "_read_chunk",
+                  "_selector",
+                  "_selector_descriptor",
+                  "socket",
+                  "_timeout"
+                ]
     """
 python.org: __slots__ reserves space for the declared variables and prevents
 the automatic creation of __dict__ and __weakref__ for each instance.
@@ -51,6 +68,26 @@ Constructor __init__(SocketReader)
 :since: v1.0.0
         """
 
+        self._is_eof = False
+        """
+True if the socket reached EOF
+        """
+        self._read_buffer = bytearray()
+        """
+Read-ahead buffer of data received but not yet read
+        """
+        self._read_chunk = None
+        """
+Reused chunk buffer to receive read-ahead data into
+        """
+        self._selector = None
+        """
+Descriptor selector registered for the socket
+        """
+        self._selector_descriptor = None
+        """
+Socket descriptor the selector is registered for
+        """
         self.socket = socket
         """
 Underlying lock instance
@@ -65,6 +102,21 @@ Lock timeout in seconds
         #
     #
 
+    @property
+    def is_data_buffered(self):
+        """
+Returns true if data can be read without waiting for the socket. This is
+the case for data in the read-ahead buffer or buffered by a TLS socket.
+
+:return: (bool) True if data is buffered
+:since:  v1.0.4
+        """
+
+        return (len(self._read_buffer) > 0
+                or (hasattr(self.socket, "pending") and self.socket.pending() > 0)
+               )
+    #
+
     @property
     def timeout(self):
         """
@@ -90,6 +142,133 @@ Sets a new lock timeout.
         self._timeout = timeout
     #
 
+    def _consume_read_buffer(self, n):
+        """
+Removes and returns the given number of bytes from the read-ahead buffer.
+
+:param n: Number of bytes
+
+:return: (bytes) Data
+:since:  v1.0.4
+        """
+
+        _return = bytes(self._read_buffer[:n])
+        del self._read_buffer[:n]
+
+        return _return
+    #
+
+    def _get_selector(self):
+        """
+Returns the descriptor selector registered for the socket. It is kept for
+the lifetime of this instance as long as the socket descriptor is not
+changed.
+
+:return: (object) DescriptorSelector instance
+:since:  v1.0.4
+        """
+
+        descriptor = self.socket.fileno()
+
+        if (self._selector is None or self._selector_descriptor != descriptor):
+            self._selector = DescriptorSelector([ descriptor ])
+            self._selector_descriptor = descriptor
+        #
+
+        return self._selector
+    #
+
+    def peek(self, n):
+        """
+Returns up to n bytes without consuming them.
+
+:param n: Number of bytes
+
+:return: (bytes) Data; Socket reached EOF (closed) if len(returned) < n
+:since:  v1.0.4
+        """
+
+        timeout_time = time() + self.timeout
+
+        while (len(self._read_buffer) < n and (not self._is_eof) and time() < timeout_time):
+            self._recv_to_read_buffer()
+        #
+
+        return bytes(self._read_buffer[:n])
+    #
+
+    def read_until(self, delimiter = b"\n", limit = -1):
+        """
+Reads data up to and including the given delimiter.
+
+:param delimiter: Delimiter to read until
+:param limit: If limit is specified, at most limit bytes will be read.
+
+:return: (bytes) Data read; Socket reached EOF (closed) or limit reached if
+         it does not end with the delimiter
+:since:  v1.0.4
+        """
+
+        offset = 0
+        timeout_time = time() + self.timeout
+
+        while True:
+            read_buffer_size = len(self._read_buffer)
+            end = (read_buffer_size if (limit < 0) else min(read_buffer_size, limit))
+
+            delimiter_position = self._read_buffer.find(delimiter, offset, end)
+
+            if (delimiter_position > -1):
+                _return = self._consume_read_buffer(delimiter_position + len(delimiter))
+                break
+            elif (limit > -1 and read_buffer_size >= limit):
+                _return = self._consume_read_buffer(limit)
+                break
+            elif (self._is_eof):
+                _return = self._consume_read_buffer(read_buffer_size)
+                break
+            #
+
+            if (time() >= timeout_time): raise IOException("Timeout occurred before the delimiter has been received")
+
+            offset = max(0, end - len(delimiter) + 1)
+            self._recv_to_read_buffer()
+        #
+
+        return _return
+    #
+
+    def readexactly(self, n):
+        """
+Reads exactly n bytes.
+
+:param n: Number of bytes
+
+:return: (bytes) Data read
+:since:  v1.0.4
+        """
+
+        _return = self.recv(n)
+
+        if (_return is None): _return = b""
+        elif (len(_return) < n): raise IOException("Failed to receive all data requested")
+
+        return _return
+    #
+
+    def readline(self, limit = -1):
+        """
+Reads one line.
+
+:param limit: If limit is specified, at most limit bytes will be read.
+
+:return: (bytes) Line read
+:since:  v1.0.4
+        """
+
+        return self.read_until(b"\n", limit)
+    #
+
     def recv(self, size):
         """
 Read data from socket.
@@ -103,24 +282,198 @@ Read data from socket.
 
         _return = None
 
-        data_size = 0
-        is_socket_valid = True
-        selector = DescriptorSelector([ self.socket.fileno() ])
+        if (size > 0):
+            buffer = bytearray(size)
+            data_size = self.recv_into(buffer)
+
+            _return = memoryview(buffer)[:data_size].tobytes()
+        #
+
+        return _return
+    #
+
+    def recv_into(self, buffer, nbytes = 0):
+        """
+Read data from socket into the given buffer.
+
+:param buffer: Writable bytes-like object
+:param nbytes: Size to receive (0 means the size of the buffer)
+
+:return: (int) Number of bytes received; Socket reached EOF (closed) if
+         less than requested
+:since: v1.0.4
+        """
+
+        view = memoryview(buffer)
+        if (nbytes < 1): nbytes = len(view)
+
+        _return = min(len(self._read_buffer), nbytes)
+
+        if (_return > 0):
+            view[:_return] = self._read_buffer[:_return]
+            del self._read_buffer[:_return]
+        #
+
+        timeout_time = time() + self.timeout
+
+        while ((not self._is_eof) and _return < nbytes and time() < timeout_time):
+            _return += self._recv_into_socket(view[_return:nbytes])
+        #
+
+        return _return
+    #
+
+    def recv_to(self, target, size):
+        """
+Read data from socket and write it to the given target in chunks. A reused
+chunk buffer is received into to keep memory bounded by its size. Each
+chunk is passed as bytes and written completely before the next one is
+received.
+
+:param target: ByteBuffer or any file-like object providing a synchronous
+               "write()"
+:param size: Size to receive
+
+:return: (int) Number of bytes received; Socket reached EOF (closed) if
+         less than requested
+:since:  v1.0.4
+        """
+
+        _return = min(len(self._read_buffer), size)
+        if (_return > 0): SocketReader._write_to_target(target, self._consume_read_buffer(_return))
+
+        if (self._read_chunk is None): self._read_chunk = bytearray(SocketReader.READ_AHEAD_SIZE)
+
+        chunk_view = memoryview(self._read_chunk)
         timeout_time = time() + self.timeout
 
-        while (is_socket_valid and data_size < size and time() < timeout_time):
-            if (len(selector.select(self.timeout, False)[0]) < 1): raise IOException("Failed to receive data")
+        while ((not self._is_eof) and _return < size and time() < timeout_time):
+            data_size_received = self._recv_into_socket(chunk_view[:size - _return])
+
+            if (data_size_received > 0):
+                SocketReader._write_to_target(target, chunk_view[:data_size_received].tobytes())
+                _return += data_size_received
+            #
+        #
+
+        return _return
+    #
+
+    def _recv_to_read_buffer(self):
+        """
+Receives one chunk of data and appends it to the read-ahead buffer.
+
+:since: v1.0.4
+        """
+
+        if (self._read_chunk is None): self._read_chunk = bytearray(SocketReader.READ_AHEAD_SIZE)
+        data_size_received = self._recv_into_socket(self._read_chunk)
+
+        if (data_size_received > 0): self._read_buffer += memoryview(self._read_chunk)[:data_size_received]
+    #
+
+    def _recv_into_socket(self, buffer):
+        """
+Receives data from the socket into the given buffer once it is readable.
+Data already decrypted and buffered by a TLS socket is received without
+waiting for the socket descriptor.
+
+:param buffer: Writable bytes-like object or list of them to scatter data
+               into
+
+:return: (int) Number of bytes received
+:since:  v1.0.4
+        """
+
+        # global: SSLWantReadError
+
+        is_data_pending = (hasattr(self.socket, "pending") and self.socket.pending() > 0)
+
+        if ((not is_data_pending)
+            and len(self._get_selector().select(self.timeout, False)[0]) < 1
+           ): raise IOException("Failed to receive data")
+
+        try:
+            _return = (self.socket.recvmsg_into(buffer)[0] if (isinstance(buffer, list)) else self.socket.recv_into(buffer))
+            if (_return == 0): self._is_eof = True
+        except SSLWantReadError: _return = 0
+
+        return _return
+    #
+
+    def recvmsg_into(self, buffers):
+        """
+Read data from socket and scatter it into the given buffers filled in
+order. All buffers are filled with one system call if possible.
+
+:param buffers: List of writable bytes-like objects
 
-            data = self.socket.recv(size - data_size)
-            data_size_received = len(data)
+:return: (int) Number of bytes received; Socket reached EOF (closed) if
+         less than the size of all buffers
+:since:  v1.0.4
+        """
+
+        views = [ memoryview(buffer) for buffer in buffers ]
+        views = [ view for view in views if len(view) > 0 ]
+
+        _return = 0
+
+        if (len(self._read_buffer) > 0):
+            for view in views:
+                size = min(len(self._read_buffer) - _return, len(view))
+                if (size < 1): break
+
+                view[:size] = self._read_buffer[_return:_return + size]
+                _return += size
+            #
+
+            del self._read_buffer[:_return]
+        #
+
+        is_scattered = (hasattr(self.socket, "recvmsg_into") and (not hasattr(self.socket, "pending")))
+        timeout_time = time() + self.timeout
+        view_offset = 0
+
+        while (len(views) > 0 and (not self._is_eof) and time() < timeout_time):
+            while (len(views) > 0 and _return - view_offset >= len(views[0])):
+                view_offset += len(views[0])
+                views.pop(0)
+            #
 
-            if (_return is None): _return = data
-            elif (data_size_received > 0): _return += data
+            if (len(views) > 0):
+                if (_return > view_offset): views[0] = views[0][_return - view_offset:]
+                view_offset = _return
 
-            data_size += data_size_received
-            if (data_size_received == 0): is_socket_valid = False
+                _return += self._recv_into_socket(views if (is_scattered) else views[0])
+            #
         #
 
         return _return
     #
+
+    @staticmethod
+    def _write_to_target(target, data):
+        """
+Writes the given data completely to the given target. Writes are repeated
+for the remaining data as long as the target reports a short one. A target
+returning None is considered to have written everything as Python 2 file
+objects do.
+
+:param target: File-like object providing "write()"
+:param data: Bytes data
+
+:since: v1.0.4
+        """
+
+        data_size = len(data)
+        data_size_written = 0
+
+        while (data_size_written < data_size):
+            written = target.write(data if (data_size_written == 0) else data[data_size_written:])
+            if (written is None): break
+
+            if (written < 1): raise IOException("Failed to write data received")
+            data_size_written += written
+        #
+    #
 #
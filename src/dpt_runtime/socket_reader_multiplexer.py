@@ -0,0 +1,299 @@
+# -*- coding: utf-8 -*-
+
+"""
+direct Python Toolbox
+All-in-one toolbox to encapsulate Python runtime variants
+----------------------------------------------------------------------------
+(C) direct Netware Group - All rights reserved
+https://www.direct-netware.de/redirect?dpt;runtime
+
+This Source Code Form is subject to the terms of the Mozilla Public License,
+v. 2.0. If a copy of the MPL was not distributed with this file, You can
+obtain one at http://mozilla.org/MPL/2.0/.
+----------------------------------------------------------------------------
+https://www.direct-netware.de/redirect?licenses;mpl2
+----------------------------------------------------------------------------
+#echo(dptRuntimeVersion)#
+#echo(__FILEPATH__)#
+"""
+
+from heapq import heappop, heappush
+from socket import socketpair
+from threading import Lock
+from time import time
+
+from .descriptor_selector import DescriptorSelector
+from .io_exception import IOException
+
+class SocketReaderMultiplexer(object):
+    """
+"SocketReaderMultiplexer" waits for many "SocketReader" instances with one
+persistent descriptor selector. "select()" returns an event for each reader
+with data ready or with its timeout exceeded. Readers are removed after an
+event and have to be registered again to wait for the next one. This allows
+other threads to handle the reader in the meantime.
+
+:author:     direct Netware Group et al.
+:copyright:  (C) direct Netware Group - All rights reserved
+:package:    dpt
+:subpackage: runtime
+:since:      v1.0.4
+:license:    https://www.direct-netware.de/redirect?licenses;mpl2
+             Mozilla Public License, v. 2.0
+    """
+
+    EVENT_READY = 1
+    """
+Data is ready to be read from the socket
+    """
+    EVENT_TIMEOUT = 2
+    """
+No data has been received within the timeout
+    """
+
+    __slots__ = [ "__weakref__",
+                  "_entries",
+                  "_events",
+                  "_lock",
+                  "_pending",
+                  "_selector",
+                  "_timeouts",
+                  "_wakeup_sockets"
+                ]
+    """
+python.org: __slots__ reserves space for the declared variables and prevents
+the automatic creation of __dict__ and __weakref__ for each instance.
+    """
+
+    def __init__(self):
+        """
+Constructor __init__(SocketReaderMultiplexer)
+
+:since: v1.0.4
+        """
+
+        self._entries = { }
+        """
+Dictionary of descriptors registered with their reader and timeout time
+        """
+        self._events = [ ]
+        """
+List of events not yet returned
+        """
+        self._lock = Lock()
+        """
+Lock used to access changes pending
+        """
+        self._pending = [ ]
+        """
+List of readers and their timeout time to register (or None to unregister)
+        """
+        self._selector = DescriptorSelector()
+        """
+Persistent descriptor selector
+        """
+        self._timeouts = [ ]
+        """
+Heap of timeout times and descriptors
+        """
+        self._wakeup_sockets = socketpair()
+        """
+Socket pair used to interrupt waiting for changes pending
+        """
+
+        for wakeup_socket in self._wakeup_sockets: wakeup_socket.setblocking(False)
+        self._selector.register(self._wakeup_sockets[0].fileno())
+    #
+
+    def __len__(self):
+        """
+python.org: Called to implement the built-in function len().
+
+:return: (int) Number of readers registered
+:since:  v1.0.4
+        """
+
+        with self._lock: return len(self._entries) + len(self._pending)
+    #
+
+    def _apply_pending(self):
+        """
+Applies registration changes requested since the last call of "select()".
+
+:since: v1.0.4
+        """
+
+        with self._lock:
+            pending = self._pending
+            self._pending = [ ]
+        #
+
+        for socket_reader, timeout_time in pending:
+            descriptor = socket_reader.socket.fileno()
+
+            if (timeout_time is None): self._remove_entry(descriptor)
+            elif (socket_reader.is_data_buffered):
+                self._remove_entry(descriptor)
+                self._events.append(( socket_reader, SocketReaderMultiplexer.EVENT_READY ))
+            else:
+                if (descriptor not in self._entries): self._selector.register(descriptor)
+
+                self._entries[descriptor] = ( socket_reader, timeout_time )
+                heappush(self._timeouts, ( timeout_time, descriptor ))
+            #
+        #
+    #
+
+    def close(self):
+        """
+Closes the multiplexer. Readers registered are not closed.
+
+:since: v1.0.4
+        """
+
+        for wakeup_socket in self._wakeup_sockets: wakeup_socket.close()
+
+        self._entries = { }
+        self._selector = DescriptorSelector()
+        self._timeouts = [ ]
+    #
+
+    def _collect_timeouts(self):
+        """
+Adds timeout events for all readers with their timeout exceeded.
+
+:return: (float) Seconds until the next timeout; -1 if none is registered
+:since:  v1.0.4
+        """
+
+        _return = -1
+        current_time = time()
+
+        while (len(self._timeouts) > 0):
+            timeout_time, descriptor = self._timeouts[0]
+            entry = self._entries.get(descriptor)
+
+            if (entry is None or entry[1] != timeout_time): heappop(self._timeouts)
+            elif (timeout_time <= current_time):
+                heappop(self._timeouts)
+                self._remove_entry(descriptor)
+
+                self._events.append(( entry[0], SocketReaderMultiplexer.EVENT_TIMEOUT ))
+            else:
+                _return = timeout_time - current_time
+                break
+            #
+        #
+
+        return _return
+    #
+
+    def register(self, socket_reader, timeout = None):
+        """
+Registers the given reader to wait for data until its timeout is exceeded.
+This method may be called from any thread.
+
+:param socket_reader: SocketReader instance
+:param timeout: Timeout in seconds (the reader timeout if None)
+
+:since: v1.0.4
+        """
+
+        if (timeout is None): timeout = socket_reader.timeout
+        self._request_change(socket_reader, time() + timeout)
+    #
+
+    def _remove_entry(self, descriptor):
+        """
+Removes the entry of the given descriptor if registered.
+
+:param descriptor: Descriptor registered
+
+:since: v1.0.4
+        """
+
+        if (self._entries.pop(descriptor, None) is not None): self._selector.unregister(descriptor)
+    #
+
+    def _request_change(self, socket_reader, timeout_time):
+        """
+Queues a registration change and interrupts a thread waiting in
+"select()".
+
+:param socket_reader: SocketReader instance
+:param timeout_time: Timeout time or None to unregister
+
+:since: v1.0.4
+        """
+
+        with self._lock: self._pending.append(( socket_reader, timeout_time ))
+
+        try: self._wakeup_sockets[1].send(b"\x00")
+        except EnvironmentError: pass
+    #
+
+    def select(self, timeout = -1):
+        """
+Waits for readers with data ready or their timeout exceeded. This method
+must only be called by one thread at a time.
+
+:param timeout: Timeout in seconds to wait for events (-1 to wait until an
+                event occurs)
+
+:return: (list) List of tuples of the SocketReader instance and event
+:since:  v1.0.4
+        """
+
+        if (self._wakeup_sockets[0].fileno() < 0): raise IOException("Multiplexer has been closed")
+
+        timeout_time = (-1 if (timeout < 0) else time() + timeout)
+
+        while True:
+            self._apply_pending()
+            next_timeout = self._collect_timeouts()
+
+            if (len(self._events) > 0): break
+
+            current_time = time()
+            if (timeout_time > -1 and current_time >= timeout_time): break
+
+            if (timeout_time > -1 and (next_timeout < 0 or timeout_time - current_time < next_timeout)):
+                next_timeout = timeout_time - current_time
+            #
+
+            wakeup_descriptor = self._wakeup_sockets[0].fileno()
+
+            for descriptor in self._selector.select(next_timeout, False, True, False)[0]:
+                if (descriptor == wakeup_descriptor):
+                    try:
+                        while (len(self._wakeup_sockets[0].recv(4096)) > 0): pass
+                    except EnvironmentError: pass
+                else:
+                    entry = self._entries.get(descriptor)
+
+                    if (entry is not None):
+                        self._remove_entry(descriptor)
+                        self._events.append(( entry[0], SocketReaderMultiplexer.EVENT_READY ))
+                    #
+                #
+            #
+        #
+
+        _return = self._events
+        self._events = [ ]
+
+        return _return
+    #
+
+    def unregister(self, socket_reader):
+        """
+Unregisters the given reader. This method may be called from any thread.
+
+:param socket_reader: SocketReader instance
+
+:since: v1.0.4
+        """
+
+        self._request_change(socket_reader, None)
+    #
+#
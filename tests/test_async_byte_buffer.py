@@ -0,0 +1,107 @@
+# -*- coding: utf-8 -*-
+
+"""
+direct Python Toolbox
+All-in-one toolbox to encapsulate Python runtime variants
+----------------------------------------------------------------------------
+(C) direct Netware Group - All rights reserved
+https://www.direct-netware.de/redirect?dpt;runtime
+
+This Source Code Form is subject to the terms of the Mozilla Public License,
+v. 2.0. If a copy of the MPL was not distributed with this file, You can
+obtain one at http://mozilla.org/MPL/2.0/.
+----------------------------------------------------------------------------
+https://www.direct-netware.de/redirect?licenses;mpl2
+----------------------------------------------------------------------------
+unittest
+"""
+
+import unittest
+
+try: import asyncio
+except ImportError: asyncio = None
+
+from dpt_runtime.async_byte_buffer import AsyncByteBuffer
+from dpt_runtime.byte_buffer import ByteBuffer
+from dpt_runtime.byte_buffer_memory_budget import ByteBufferMemoryBudget
+
+@unittest.skipIf(asyncio is None, "asyncio is not supported by this Python runtime")
+class TestAsyncByteBuffer(unittest.TestCase):
+    """
+UnitTest for AsyncByteBuffer
+
+:since: v1.0.4
+    """
+
+    def setUp(self):
+        self.loop = asyncio.new_event_loop()
+    #
+
+    def tearDown(self):
+        self.loop.close()
+    #
+
+    def test_blocking_writes(self):
+        async_buffer = AsyncByteBuffer(loop = self.loop)
+        async_buffer.byte_buffer.request_write_buffer_to_file()
+
+        future = async_buffer.write(b"data")
+        self.assertFalse(future.done())
+
+        self.loop.run_until_complete(async_buffer.drain())
+        self.assertIsNotNone(async_buffer.byte_buffer.buffer_file)
+
+        self.loop.run_until_complete(async_buffer.close())
+
+        ByteBufferMemoryBudget.set_limit(1048576)
+
+        try:
+            async_buffer = AsyncByteBuffer(loop = self.loop)
+
+            future = async_buffer.writev([ b"da", b"ta" ])
+            self.assertFalse(future.done())
+
+            self.assertEqual(4, self.loop.run_until_complete(future))
+            self.assertTrue(async_buffer.write(b"data").done())
+        finally: ByteBufferMemoryBudget.set_limit(0)
+    #
+
+    def test_memory(self):
+        async_buffer = AsyncByteBuffer(loop = self.loop)
+
+        future = async_buffer.write(b"line 1\nline 2\n")
+        self.assertTrue(future.done())
+        self.assertEqual(14, future.result())
+
+        self.assertTrue(async_buffer.drain().done())
+        self.assertEqual(0, self.loop.run_until_complete(async_buffer.seek(0)))
+        self.assertEqual(b"line 1\n", self.loop.run_until_complete(async_buffer.readline()))
+        self.assertEqual(b"line 2\n", self.loop.run_until_complete(async_buffer.read()))
+        self.assertIsNone(async_buffer.byte_buffer.buffer_file)
+    #
+
+    def test_spilled(self):
+        byte_buffer = ByteBuffer()
+        byte_buffer.file_threshold = 16384
+
+        async_buffer = AsyncByteBuffer(byte_buffer, self.loop)
+
+        data = b"".join([ "{0:08d}".format(i).encode("ascii") for i in range(8192) ])
+        futures = [ async_buffer.write(data[i:i + 4096]) for i in range(0, len(data), 4096) ]
+
+        self.loop.run_until_complete(async_buffer.drain())
+
+        self.assertTrue(all(future.done() for future in futures))
+        self.assertIsNotNone(byte_buffer.buffer_file)
+        self.assertEqual(len(data), async_buffer.size)
+
+        self.loop.run_until_complete(async_buffer.seek(0))
+        self.assertEqual(data, self.loop.run_until_complete(async_buffer.read()))
+
+        self.loop.run_until_complete(async_buffer.close())
+    #
+#
+
+if (__name__ == "__main__"):
+    unittest.main()
+#
@@ -0,0 +1,78 @@
+# -*- coding: utf-8 -*-
+
+"""
+direct Python Toolbox
+All-in-one toolbox to encapsulate Python runtime variants
+----------------------------------------------------------------------------
+(C) direct Netware Group - All rights reserved
+https://www.direct-netware.de/redirect?dpt;runtime
+
+This Source Code Form is subject to the terms of the Mozilla Public License,
+v. 2.0. If a copy of the MPL was not distributed with this file, You can
+obtain one at http://mozilla.org/MPL/2.0/.
+----------------------------------------------------------------------------
+https://www.direct-netware.de/redirect?licenses;mpl2
+----------------------------------------------------------------------------
+unittest
+"""
+
+from socket import socketpair
+import unittest
+
+try: import asyncio
+except ImportError: asyncio = None
+
+from dpt_runtime.async_socket_reader import AsyncSocketReader
+from dpt_runtime.io_exception import IOException
+
+@unittest.skipIf(asyncio is None, "asyncio is not supported by this Python runtime")
+class TestAsyncSocketReader(unittest.TestCase):
+    """
+UnitTest for AsyncSocketReader
+
+:since: v1.0.4
+    """
+
+    def setUp(self):
+        self.loop = asyncio.new_event_loop()
+        self.socket, self.peer_socket = socketpair()
+    #
+
+    def tearDown(self):
+        self.socket.close()
+        self.peer_socket.close()
+        self.loop.close()
+    #
+
+    def test_recv(self):
+        data = b"".join([ "line {0:d}\n".format(i).encode("ascii") for i in range(50000) ])
+        socket_reader = AsyncSocketReader(self.socket, 1, self.loop)
+
+        future = socket_reader.recv(len(data))
+        self.peer_socket.setblocking(False)
+        send_future = asyncio.ensure_future(self.loop.sock_sendall(self.peer_socket, data), loop = self.loop)
+
+        self.assertEqual(data, self.loop.run_until_complete(future))
+        self.loop.run_until_complete(send_future)
+
+        self.assertRaises(IOException, self.loop.run_until_complete, socket_reader.recv(1))
+
+        self.peer_socket.close()
+        self.assertEqual(b"", self.loop.run_until_complete(socket_reader.recv(1)))
+    #
+
+    def test_sock_recv_into_copy(self):
+        socket_reader = AsyncSocketReader(self.socket, 1, self.loop)
+        self.peer_socket.sendall(b"data")
+
+        buffer = bytearray(8)
+        future = socket_reader._sock_recv_into_copy(self.loop, memoryview(buffer)[2:])
+
+        self.assertEqual(4, self.loop.run_until_complete(future))
+        self.assertEqual(b"\x00\x00data\x00\x00", bytes(buffer))
+    #
+#
+
+if (__name__ == "__main__"):
+    unittest.main()
+#
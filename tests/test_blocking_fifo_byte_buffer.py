@@ -0,0 +1,71 @@
+# -*- coding: utf-8 -*-
+
+"""
+direct Python Toolbox
+All-in-one toolbox to encapsulate Python runtime variants
+----------------------------------------------------------------------------
+(C) direct Netware Group - All rights reserved
+https://www.direct-netware.de/redirect?dpt;runtime
+
+This Source Code Form is subject to the terms of the Mozilla Public License,
+v. 2.0. If a copy of the MPL was not distributed with this file, You can
+obtain one at http://mozilla.org/MPL/2.0/.
+----------------------------------------------------------------------------
+https://www.direct-netware.de/redirect?licenses;mpl2
+----------------------------------------------------------------------------
+unittest
+"""
+
+from threading import Thread
+import unittest
+
+from dpt_runtime.blocking_fifo_byte_buffer import BlockingFifoByteBuffer
+from dpt_runtime.io_exception import IOException
+
+class TestBlockingFifoByteBuffer(unittest.TestCase):
+    """
+UnitTest for BlockingFifoByteBuffer
+
+:since: v1.0.4
+    """
+
+    def test_producer_consumer(self):
+        fifo_buffer = BlockingFifoByteBuffer(high_water_mark = 64, timeout = 5)
+        lines = [ "line {0:d}\n".format(i).encode("ascii") for i in range(1000) ]
+
+        def _produce():
+            for line in lines: fifo_buffer.write(line)
+            fifo_buffer.set_eof()
+        #
+
+        producer = Thread(target = _produce)
+        producer.start()
+
+        read_lines = [ ]
+
+        while (not fifo_buffer.is_eof):
+            line = fifo_buffer.readline()
+            if (len(line) > 0): read_lines.append(line)
+
+            self.assertLessEqual(fifo_buffer.available, 64 + len(lines[-1]))
+        #
+
+        producer.join()
+
+        self.assertEqual(lines, read_lines)
+        self.assertEqual(b"", fifo_buffer.read())
+        self.assertRaises(IOException, fifo_buffer.write, b"data")
+    #
+
+    def test_timeout(self):
+        fifo_buffer = BlockingFifoByteBuffer(high_water_mark = 4, timeout = 0.05)
+        self.assertRaises(IOException, fifo_buffer.read)
+
+        fifo_buffer.write(b"data")
+        self.assertRaises(IOException, fifo_buffer.write, b"data")
+    #
+#
+
+if (__name__ == "__main__"):
+    unittest.main()
+#
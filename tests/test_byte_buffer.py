@@ -0,0 +1,365 @@
+# -*- coding: utf-8 -*-
+
+"""
+direct Python Toolbox
+All-in-one toolbox to encapsulate Python runtime variants
+----------------------------------------------------------------------------
+(C) direct Netware Group - All rights reserved
+https://www.direct-netware.de/redirect?dpt;runtime
+
+This Source Code Form is subject to the terms of the Mozilla Public License,
+v. 2.0. If a copy of the MPL was not distributed with this file, You can
+obtain one at http://mozilla.org/MPL/2.0/.
+----------------------------------------------------------------------------
+https://www.direct-netware.de/redirect?licenses;mpl2
+----------------------------------------------------------------------------
+unittest
+"""
+
+import errno
+import hashlib
+from io import BytesIO
+import os
+from os import path
+from shutil import rmtree
+import sys
+from tempfile import TemporaryFile, mkdtemp
+import unittest
+
+try: import fcntl
+except ImportError: fcntl = None
+
+from dpt_settings import Settings
+
+from dpt_runtime.byte_buffer import ByteBuffer
+from dpt_runtime.io_exception import IOException
+
+class TestByteBuffer(unittest.TestCase):
+    """
+UnitTest for ByteBuffer
+
+:since: v1.0.4
+    """
+
+    data = b"".join([ "line {0:d}\n".format(i).encode("ascii") for i in range(5000) ])
+    """
+Test data used for the buffer
+    """
+
+    def _get_buffer(self, file_threshold = None):
+        _return = ByteBuffer()
+        if (file_threshold is not None): _return.file_threshold = file_threshold
+
+        for i in range(0, len(TestByteBuffer.data), 1000):
+            _return.write(TestByteBuffer.data[i:i + 1000])
+        #
+
+        return _return
+    #
+
+    def test_memory(self):
+        byte_buffer = self._get_buffer()
+
+        self.assertIsNone(byte_buffer.buffer_file)
+        self.assertEqual(len(TestByteBuffer.data), byte_buffer.size)
+
+        self.assertEqual(b"line 0\n", byte_buffer.readline())
+        self.assertEqual(b"line", byte_buffer.read(4))
+        self.assertEqual(TestByteBuffer.data[11:], byte_buffer.read())
+
+        self.assertRaises(IOException, byte_buffer.write, b"data")
+    #
+
+    def test_spilled(self):
+        byte_buffer = self._get_buffer(4096)
+
+        self.assertIsNone(byte_buffer.buffer)
+        self.assertIsNotNone(byte_buffer.buffer_file)
+        self.assertEqual(len(TestByteBuffer.data), byte_buffer.size)
+
+        self.assertEqual(TestByteBuffer.data, byte_buffer.read())
+
+        byte_buffer.seek(7)
+        self.assertEqual(b"line 1\n", byte_buffer.readline())
+    #
+
+    def test_readinto(self):
+        for byte_buffer in ( self._get_buffer(), self._get_buffer(4096) ):
+            data = bytearray(10)
+
+            self.assertEqual(10, byte_buffer.readinto(data))
+            self.assertEqual(TestByteBuffer.data[:10], bytes(data))
+
+            byte_buffer.seek(len(TestByteBuffer.data) - 4)
+            self.assertEqual(4, byte_buffer.readinto(data))
+            self.assertEqual(TestByteBuffer.data[-4:], bytes(data[:4]))
+        #
+    #
+
+    def test_digests(self):
+        byte_buffer = ByteBuffer(digests = [ "sha256", hashlib.md5() ])
+        byte_buffer.file_threshold = 4096
+
+        for i in range(0, len(TestByteBuffer.data), 1000):
+            byte_buffer.write(TestByteBuffer.data[i:i + 1000])
+        #
+
+        self.assertRaises(IOException, lambda: byte_buffer.digests)
+
+        self.assertEqual(b"line 0\n", byte_buffer.readline())
+
+        digests = byte_buffer.digests
+        self.assertEqual(hashlib.sha256(TestByteBuffer.data).hexdigest(), digests['sha256'].hexdigest())
+        self.assertEqual(hashlib.md5(TestByteBuffer.data).hexdigest(), digests['md5'].hexdigest())
+
+        if (hasattr(hashlib, "blake2b")):
+            byte_buffer = ByteBuffer(digests = [ "SHA256", hashlib.blake2b(digest_size = 16) ])
+
+            for _ in range(2):
+                byte_buffer.clear()
+                byte_buffer.write(TestByteBuffer.data)
+                byte_buffer.seek(0)
+
+                digests = byte_buffer.digests
+                self.assertEqual(hashlib.sha256(TestByteBuffer.data).hexdigest(), digests['SHA256'].hexdigest())
+                self.assertEqual(hashlib.blake2b(TestByteBuffer.data, digest_size = 16).hexdigest(), digests['blake2b'].hexdigest())
+            #
+        #
+    #
+
+    def _get_buffer_file_path(self, byte_buffer):
+        self.assertIsNotNone(byte_buffer.buffer_file)
+        return os.readlink("/proc/self/fd/{0:d}".format(byte_buffer.buffer_file.fileno()))
+    #
+
+    @unittest.skipUnless(path.isdir("/proc/self/fd"), "requires /proc/self/fd")
+    def test_file_backends(self):
+        directory_path = mkdtemp()
+
+        try:
+            Settings.set("dpt_runtime_byte_buffer_file_directory", directory_path)
+
+            byte_buffer = self._get_buffer(4096)
+            self.assertTrue(self._get_buffer_file_path(byte_buffer).startswith(directory_path))
+            self.assertEqual(TestByteBuffer.data, byte_buffer.read())
+
+            if (hasattr(os, "memfd_create")):
+                Settings.set("dpt_runtime_byte_buffer_file_backend", "memfd")
+
+                byte_buffer = self._get_buffer(4096)
+                self.assertTrue(self._get_buffer_file_path(byte_buffer).startswith("/memfd:"))
+                self.assertEqual(TestByteBuffer.data, byte_buffer.read())
+
+                Settings.set("dpt_runtime_byte_buffer_file_backend", None)
+            #
+
+            Settings.set("dpt_runtime_byte_buffer_file_directory", path.join(directory_path, "missing"))
+
+            byte_buffer = self._get_buffer(4096)
+            self.assertFalse(self._get_buffer_file_path(byte_buffer).startswith(directory_path))
+            self.assertEqual(TestByteBuffer.data, byte_buffer.read())
+        finally:
+            Settings.set("dpt_runtime_byte_buffer_file_backend", None)
+            Settings.set("dpt_runtime_byte_buffer_file_directory", None)
+
+            rmtree(directory_path)
+        #
+    #
+
+    def test_getbuffer(self):
+        byte_buffer = self._get_buffer()
+
+        view = byte_buffer.getbuffer()
+        self.assertTrue(view.readonly)
+        self.assertEqual(TestByteBuffer.data, view.tobytes())
+
+        self.assertIsNone(self._get_buffer(4096).getbuffer())
+    #
+
+    def test_getbuffers(self):
+        byte_buffer = ByteBuffer()
+        byte_buffer.write(b"x" * 8192)
+        byte_buffer.write(b"y" * 8192)
+
+        views = byte_buffer.getbuffers()
+        self.assertEqual(2, len(views))
+        self.assertEqual(b"x" * 8192 + b"y" * 8192, b"".join(view.tobytes() for view in views))
+
+        self.assertIsNone(self._get_buffer(4096).getbuffers())
+    #
+
+    def test_mmap(self):
+        byte_buffer = ByteBuffer()
+        byte_buffer.file_mmap = True
+        byte_buffer.file_threshold = 4096
+
+        byte_buffer.write(TestByteBuffer.data)
+        self.assertEqual(0, byte_buffer.seek(0))
+
+        self.assertIsNotNone(byte_buffer.buffer_mmap)
+        self.assertEqual(b"line 0\n", byte_buffer.readline())
+
+        data = bytearray(7)
+        self.assertEqual(7, byte_buffer.readinto(data))
+        self.assertEqual(b"line 1\n", bytes(data))
+
+        self.assertEqual(b"li", byte_buffer.readline(2))
+        self.assertEqual(b"ne 2\n", byte_buffer.readline(64))
+
+        self.assertEqual(TestByteBuffer.data[21:], byte_buffer.read())
+
+        self.assertEqual(len(TestByteBuffer.data), byte_buffer.seek(len(TestByteBuffer.data) + 16))
+        self.assertEqual(b"", byte_buffer.read())
+
+        view = byte_buffer.getbuffer()
+
+        # Python 2 memory maps do not support views
+        if (view is None): self.assertLess(sys.version_info[0], 3)
+        else:
+            self.assertEqual(TestByteBuffer.data, view.tobytes())
+            byte_buffer.clear(True)
+
+            self.assertIsNone(byte_buffer.buffer_mmap)
+            self.assertEqual(TestByteBuffer.data, view.tobytes())
+            view.release()
+        #
+    #
+
+    def test_persist(self):
+        directory_path = mkdtemp()
+
+        try:
+            file_modes = set()
+
+            for file_threshold in ( None, 4096 ):
+                file_path = path.join(directory_path, "persisted")
+
+                byte_buffer = self._get_buffer(file_threshold)
+                byte_buffer.persist(file_path)
+
+                self.assertEqual(0, byte_buffer.size)
+                with open(file_path, "rb") as persisted_file: self.assertEqual(TestByteBuffer.data, persisted_file.read())
+
+                file_modes.add(os.stat(file_path).st_mode)
+            #
+
+            self.assertEqual(1, len(file_modes))
+        finally: rmtree(directory_path)
+    #
+
+    def test_random_access(self):
+        data = TestByteBuffer.data
+
+        for byte_buffer in ( self._get_buffer(), self._get_buffer(4096) ):
+            self.assertEqual(data.find(b"line 4999"), byte_buffer.find(b"line 4999"))
+            self.assertEqual(data.find(b"\nline 12", 100), byte_buffer.find(b"\nline 12", 100))
+            self.assertEqual(-1, byte_buffer.find(b"line 4999", 0, 100))
+            self.assertEqual(data.find(b"line", -25), byte_buffer.find(b"line", -25))
+            self.assertEqual(data.find(b"line", -25, -5), byte_buffer.find(b"line", -25, -5))
+            self.assertEqual(data.find(b"line", -(len(data) + 10), 20), byte_buffer.find(b"line", -(len(data) + 10), 20))
+            self.assertEqual(data.find(b"", len(data) + 1), byte_buffer.find(b"", len(data) + 1))
+            self.assertEqual(data.find(b"", -3), byte_buffer.find(b"", -3))
+
+            self.assertEqual(data[100:200], byte_buffer[100:200])
+            self.assertEqual(data[-10:], byte_buffer[-10:])
+
+            self.assertEqual(5000, byte_buffer.get_line_count())
+            self.assertEqual(b"line 1234\n", byte_buffer.get_line(1234))
+            self.assertEqual(b"line 4999\n", byte_buffer.get_line(-1))
+            self.assertEqual(data.split(b"3\n")[12] + b"3\n", byte_buffer.get_line(12, b"3\n"))
+
+            self.assertEqual(b"line 0\n", byte_buffer.readline())
+        #
+    #
+
+    def test_writev(self):
+        lines = TestByteBuffer.data.splitlines(True)
+
+        for file_threshold in ( None, 4096 ):
+            byte_buffer = ByteBuffer(( "sha256", ))
+            if (file_threshold is not None): byte_buffer.file_threshold = file_threshold
+
+            self.assertEqual(len(TestByteBuffer.data) - len(b"".join(lines[:5])), byte_buffer.writev(lines[5:2000]) + byte_buffer.writev(lines[2000:]))
+            byte_buffer.writelines(lines[:5])
+
+            self.assertEqual(file_threshold is not None, byte_buffer.buffer_file is not None)
+
+            byte_buffer.seek(0)
+            self.assertEqual(b"".join(lines[5:] + lines[:5]), byte_buffer.read())
+            self.assertEqual(hashlib.sha256(b"".join(lines[5:] + lines[:5])).hexdigest(), byte_buffer.digests['sha256'].hexdigest())
+        #
+    #
+
+    def test_write_from(self):
+        data = TestByteBuffer.data
+
+        with TemporaryFile() as source_file:
+            source_file.write(data)
+            source_file.flush()
+
+            for file_threshold in ( None, 4096 ):
+                for length in ( None, 30000 ):
+                    source_file.seek(0)
+                    source_fd = source_file.fileno()
+
+                    byte_buffer = ByteBuffer()
+                    if (file_threshold is not None): byte_buffer.file_threshold = file_threshold
+
+                    byte_buffer.write(data[:10])
+                    self.assertEqual(len(data[:length]), byte_buffer.write_from(source_fd, length))
+                    self.assertEqual(len(data) - 10, byte_buffer.write_from(BytesIO(data[10:])))
+
+                    byte_buffer.seek(0)
+                    self.assertEqual(data[:10] + data[:length] + data[10:], byte_buffer.read())
+                #
+            #
+        #
+    #
+
+    @unittest.skipIf(fcntl is None, "fcntl is not supported")
+    def test_write_from_non_blocking(self):
+        for file_threshold in ( None, 4096 ):
+            read_fd, write_fd = os.pipe()
+
+            try:
+                fcntl.fcntl(read_fd, fcntl.F_SETFL, fcntl.fcntl(read_fd, fcntl.F_GETFL) | os.O_NONBLOCK)
+
+                byte_buffer = self._get_buffer(file_threshold)
+                os.write(write_fd, b"data")
+
+                with self.assertRaises(EnvironmentError) as context: byte_buffer.write_from(read_fd)
+                self.assertEqual(errno.EAGAIN, context.exception.errno)
+
+                os.close(write_fd)
+                write_fd = None
+
+                self.assertEqual(0, byte_buffer.write_from(read_fd))
+
+                byte_buffer.seek(0)
+                self.assertEqual(TestByteBuffer.data + b"data", byte_buffer.read())
+            finally:
+                os.close(read_fd)
+                if (write_fd is not None): os.close(write_fd)
+            #
+        #
+    #
+
+    def test_segments(self):
+        byte_buffer = ByteBuffer()
+
+        for data in ( b"a" * 10, b"b" * 70000, b"c\nd", b"e" * 5000 ): byte_buffer.write(data)
+        expected = b"a" * 10 + b"b" * 70000 + b"c\nd" + b"e" * 5000
+
+        byte_buffer.seek(5)
+        self.assertEqual(expected[5:70012], byte_buffer.readline())
+        self.assertEqual(expected[70012:70021], byte_buffer.read(9))
+
+        byte_buffer.seek(0)
+        self.assertEqual(expected, byte_buffer.read())
+        self.assertEqual(b"", byte_buffer.read())
+    #
+#
+
+if (__name__ == "__main__"):
+    unittest.main()
+#
@@ -0,0 +1,98 @@
+# -*- coding: utf-8 -*-
+
+"""
+direct Python Toolbox
+All-in-one toolbox to encapsulate Python runtime variants
+----------------------------------------------------------------------------
+(C) direct Netware Group - All rights reserved
+https://www.direct-netware.de/redirect?dpt;runtime
+
+This Source Code Form is subject to the terms of the Mozilla Public License,
+v. 2.0. If a copy of the MPL was not distributed with this file, You can
+obtain one at http://mozilla.org/MPL/2.0/.
+----------------------------------------------------------------------------
+https://www.direct-netware.de/redirect?licenses;mpl2
+----------------------------------------------------------------------------
+unittest
+"""
+
+from threading import Thread
+import unittest
+
+from dpt_runtime.byte_buffer import ByteBuffer
+
+class TestByteBufferCursor(unittest.TestCase):
+    """
+UnitTest for ByteBufferCursor
+
+:since: v1.0.4
+    """
+
+    data = b"".join([ "line {0:d}\n".format(i).encode("ascii") for i in range(5000) ])
+    """
+Test data used for the buffer
+    """
+
+    def _get_buffers(self):
+        for file_threshold, file_mmap in ( ( None, False ), ( 4096, False ), ( 4096, True ) ):
+            byte_buffer = ByteBuffer()
+            byte_buffer.file_mmap = file_mmap
+            if (file_threshold is not None): byte_buffer.file_threshold = file_threshold
+
+            for i in range(0, len(TestByteBufferCursor.data), 1000):
+                byte_buffer.write(TestByteBufferCursor.data[i:i + 1000])
+            #
+
+            yield byte_buffer
+        #
+    #
+
+    def test_concurrent(self):
+        for byte_buffer in self._get_buffers():
+            results = [ ]
+
+            def _read(cursor):
+                results.append(b"".join(iter(lambda: cursor.read(333), b"")))
+            #
+
+            threads = [ Thread(target = _read, args = ( byte_buffer.get_cursor(), )) for _ in range(4) ]
+
+            for thread in threads: thread.start()
+            for thread in threads: thread.join()
+
+            self.assertEqual([ TestByteBufferCursor.data ] * 4, results)
+            self.assertEqual(0, byte_buffer.tell())
+
+            byte_buffer.close()
+        #
+    #
+
+    def test_positions(self):
+        for byte_buffer in self._get_buffers():
+            cursor = byte_buffer.get_cursor(7)
+            other_cursor = byte_buffer.get_cursor()
+
+            self.assertEqual(b"line 1\n", cursor.readline())
+            self.assertEqual(b"line 0\n", other_cursor.readline())
+            self.assertEqual(b"line 2\n", cursor.readline(100))
+            self.assertEqual(b"li", other_cursor.readline(2))
+
+            b = bytearray(5)
+            self.assertEqual(5, cursor.readinto(b))
+            self.assertEqual(b"line ", bytes(b))
+
+            cursor.seek(len(TestByteBufferCursor.data) - 8)
+            self.assertEqual(b"ne 4999\n", cursor.read())
+            self.assertEqual(b"", cursor.read())
+            self.assertEqual(len(TestByteBufferCursor.data), cursor.tell())
+
+            self.assertEqual(TestByteBufferCursor.data[9:], other_cursor.read())
+
+            byte_buffer.close()
+        #
+    #
+#
+
+if (__name__ == "__main__"):
+    unittest.main()
+#
@@ -0,0 +1,94 @@
+# -*- coding: utf-8 -*-
+
+"""
+direct Python Toolbox
+All-in-one toolbox to encapsulate Python runtime variants
+----------------------------------------------------------------------------
+(C) direct Netware Group - All rights reserved
+https://www.direct-netware.de/redirect?dpt;runtime
+
+This Source Code Form is subject to the terms of the Mozilla Public License,
+v. 2.0. If a copy of the MPL was not distributed with this file, You can
+obtain one at http://mozilla.org/MPL/2.0/.
+----------------------------------------------------------------------------
+https://www.direct-netware.de/redirect?licenses;mpl2
+----------------------------------------------------------------------------
+unittest
+"""
+
+import unittest
+
+from dpt_runtime.byte_buffer import ByteBuffer
+from dpt_runtime.byte_buffer_memory_budget import ByteBufferMemoryBudget
+
+class TestByteBufferMemoryBudget(unittest.TestCase):
+    """
+UnitTest for ByteBufferMemoryBudget
+
+:since: v1.0.4
+    """
+
+    def setUp(self):
+        ByteBufferMemoryBudget.set_limit(4 * ByteBufferMemoryBudget.RESERVATION_SIZE)
+    #
+
+    def tearDown(self):
+        ByteBufferMemoryBudget.set_limit(0)
+    #
+
+    def test_budget(self):
+        usage = ByteBufferMemoryBudget.get_usage()
+
+        large_buffer = ByteBuffer()
+        large_buffer.write(b"a" * (3 * ByteBufferMemoryBudget.RESERVATION_SIZE))
+
+        small_buffer = ByteBuffer()
+        small_buffer.write(b"b" * 16)
+
+        self.assertEqual(usage + 4 * ByteBufferMemoryBudget.RESERVATION_SIZE, ByteBufferMemoryBudget.get_usage())
+
+        small_buffer.write(b"b" * ByteBufferMemoryBudget.RESERVATION_SIZE)
+        self.assertIsNotNone(small_buffer.buffer_file)
+        self.assertEqual(usage + 3 * ByteBufferMemoryBudget.RESERVATION_SIZE, ByteBufferMemoryBudget.get_usage())
+
+        large_buffer.write(b"a")
+        self.assertIsNotNone(large_buffer.buffer_file)
+        self.assertEqual(usage, ByteBufferMemoryBudget.get_usage())
+
+        medium_buffer = ByteBuffer()
+        medium_buffer.write(b"c" * (2 * ByteBufferMemoryBudget.RESERVATION_SIZE))
+        self.assertIsNone(medium_buffer.buffer_file)
+        self.assertEqual(usage + 2 * ByteBufferMemoryBudget.RESERVATION_SIZE, ByteBufferMemoryBudget.get_usage())
+
+        self.assertEqual(b"b" * (16 + ByteBufferMemoryBudget.RESERVATION_SIZE), small_buffer.read())
+
+        self.assertEqual(b"a" * (3 * ByteBufferMemoryBudget.RESERVATION_SIZE + 1), large_buffer.read())
+
+        del large_buffer
+        del medium_buffer
+        del small_buffer
+
+        self.assertEqual(usage, ByteBufferMemoryBudget.get_usage())
+    #
+
+    def test_small_buffers(self):
+        usage = ByteBufferMemoryBudget.get_usage()
+        buffers = [ ByteBuffer() for _ in range(4) ]
+
+        for byte_buffer in buffers:
+            for _ in range(40): byte_buffer.write(b"d" * 100)
+        #
+
+        self.assertEqual(usage + 4 * ByteBufferMemoryBudget.RESERVATION_SIZE, ByteBufferMemoryBudget.get_usage())
+        for byte_buffer in buffers: self.assertIsNone(byte_buffer.buffer_file)
+
+        del buffers
+        del byte_buffer
+
+        self.assertEqual(usage, ByteBufferMemoryBudget.get_usage())
+    #
+#
+
+if (__name__ == "__main__"):
+    unittest.main()
+#
@@ -0,0 +1,88 @@
+# -*- coding: utf-8 -*-
+
+"""
+direct Python Toolbox
+All-in-one toolbox to encapsulate Python runtime variants
+----------------------------------------------------------------------------
+(C) direct Netware Group - All rights reserved
+https://www.direct-netware.de/redirect?dpt;runtime
+
+This Source Code Form is subject to the terms of the Mozilla Public License,
+v. 2.0. If a copy of the MPL was not distributed with this file, You can
+obtain one at http://mozilla.org/MPL/2.0/.
+----------------------------------------------------------------------------
+https://www.direct-netware.de/redirect?licenses;mpl2
+----------------------------------------------------------------------------
+unittest
+"""
+
+import unittest
+
+from dpt_runtime.byte_buffer import ByteBuffer
+from dpt_runtime.byte_buffer_pool import ByteBufferPool
+
+class TestByteBufferPool(unittest.TestCase):
+    """
+UnitTest for ByteBufferPool
+
+:since: v1.0.4
+    """
+
+    def test_reuse(self):
+        pool = ByteBufferPool(size = 2, retained_files = 1)
+
+        with pool.buffer() as byte_buffer:
+            byte_buffer.file_threshold = 16
+            byte_buffer.write(b"data" * 16)
+
+            self.assertIsNotNone(byte_buffer.buffer_file)
+            buffer_file = byte_buffer.buffer_file
+
+            self.assertEqual(b"data" * 16, byte_buffer.read())
+        #
+
+        self.assertEqual(1, len(pool))
+
+        byte_buffer = pool.acquire()
+        self.assertEqual(0, len(pool))
+
+        self.assertTrue(byte_buffer.is_writable)
+        self.assertEqual(0, byte_buffer.size)
+        self.assertEqual(ByteBuffer().file_threshold, byte_buffer.file_threshold)
+
+        byte_buffer.file_threshold = 16
+        byte_buffer.write(b"data" * 16)
+        self.assertIs(buffer_file, byte_buffer.buffer_file)
+        self.assertEqual(b"data" * 16, byte_buffer.read())
+
+        buffers = [ byte_buffer, pool.acquire(), pool.acquire() ]
+        for byte_buffer in buffers: pool.release(byte_buffer)
+
+        self.assertEqual(2, len(pool))
+    #
+
+    def test_release(self):
+        pool = ByteBufferPool(size = 2, retained_files = 0)
+
+        byte_buffer = pool.acquire()
+        byte_buffer.file_mmap = True
+        byte_buffer.set_digests([ "sha256" ])
+        byte_buffer.write(b"data")
+
+        pool.release(byte_buffer)
+        pool.release(byte_buffer)
+
+        self.assertEqual(1, len(pool))
+        self.assertIs(byte_buffer, pool.acquire())
+        self.assertEqual(0, len(pool))
+
+        self.assertFalse(byte_buffer.file_mmap)
+        byte_buffer.write(b"data")
+        self.assertEqual(b"data", byte_buffer.read())
+        self.assertEqual({ }, byte_buffer.digests)
+    #
+#
+
+if (__name__ == "__main__"):
+    unittest.main()
+#
@@ -0,0 +1,123 @@
+# -*- coding: utf-8 -*-
+
+"""
+direct Python Toolbox
+All-in-one toolbox to encapsulate Python runtime variants
+----------------------------------------------------------------------------
+(C) direct Netware Group - All rights reserved
+https://www.direct-netware.de/redirect?dpt;runtime
+
+This Source Code Form is subject to the terms of the Mozilla Public License,
+v. 2.0. If a copy of the MPL was not distributed with this file, You can
+obtain one at http://mozilla.org/MPL/2.0/.
+----------------------------------------------------------------------------
+https://www.direct-netware.de/redirect?licenses;mpl2
+----------------------------------------------------------------------------
+unittest
+"""
+
+from tempfile import TemporaryFile
+import unittest
+
+from dpt_settings import Settings
+
+from dpt_runtime.byte_buffer import ByteBuffer
+from dpt_runtime.compressed_spill_file import CompressedSpillFile
+from dpt_runtime.io_exception import IOException
+
+class TestCompressedSpillFile(unittest.TestCase):
+    """
+UnitTest for CompressedSpillFile
+
+:since: v1.0.4
+    """
+
+    data = b"".join([ "line {0:d}\n".format(i).encode("ascii") for i in range(5000) ])
+    """
+Test data written compressed
+    """
+
+    def setUp(self):
+        self.block_size = CompressedSpillFile.BLOCK_SIZE
+        CompressedSpillFile.BLOCK_SIZE = 4096
+    #
+
+    def tearDown(self):
+        CompressedSpillFile.BLOCK_SIZE = self.block_size
+    #
+
+    def test_codecs(self):
+        data = TestCompressedSpillFile.data
+
+        for codec in ( "zlib", "lzma" ):
+            if (not CompressedSpillFile.is_codec_supported(codec)): continue
+
+            spill_file = CompressedSpillFile(TemporaryFile(), codec)
+
+            for size in ( 1, 100, 4095, 4096, 4097, 10000 ):
+                spill_file.write(data[spill_file.tell():spill_file.tell() + size])
+            #
+
+            spill_file.write(data[spill_file.tell():])
+            self.assertLess(spill_file.file.tell(), len(data))
+
+            spill_file.seek(0)
+            self.assertEqual(data, spill_file.read())
+
+            for offset in ( 0, 4090, 12345, len(data) - 3 ):
+                spill_file.seek(offset)
+
+                line_end = data.find(b"\n", offset) + 1
+                self.assertEqual(data[offset:line_end], spill_file.readline())
+
+                self.assertEqual(data[line_end:line_end + 5000], spill_file.read(5000))
+            #
+
+            spill_file.close()
+        #
+    #
+
+    def test_inconsistent_block(self):
+        spill_file = CompressedSpillFile(TemporaryFile(), "zlib")
+        spill_file.write(TestCompressedSpillFile.data[:3 * 4096])
+
+        spill_file._offsets[1] += 100
+
+        spill_file.seek(4096)
+        self.assertRaises(IOException, spill_file.read, 200)
+
+        spill_file.seek(4096)
+        self.assertRaises(IOException, spill_file.readline)
+
+        spill_file.close()
+    #
+
+    def test_byte_buffer(self):
+        data = TestCompressedSpillFile.data
+
+        for codec in ( "zlib", "lzma" ):
+            if (not CompressedSpillFile.is_codec_supported(codec)): continue
+
+            Settings.set("dpt_runtime_byte_buffer_file_codec", codec)
+
+            try:
+                byte_buffer = ByteBuffer()
+                byte_buffer.file_threshold = 4096
+
+                for i in range(0, len(data), 1000): byte_buffer.write(data[i:i + 1000])
+
+                self.assertIsInstance(byte_buffer.buffer_file, CompressedSpillFile)
+                self.assertEqual(data, byte_buffer.read())
+
+                self.assertEqual(data[12345:12400], byte_buffer.read_at(12345, 55))
+                self.assertEqual(data.find(b"line 4321\n"), byte_buffer.find(b"line 4321\n"))
+
+                byte_buffer.close()
+            finally: Settings.set("dpt_runtime_byte_buffer_file_codec", None)
+        #
+    #
+#
+
+if (__name__ == "__main__"):
+    unittest.main()
+#
@@ -0,0 +1,81 @@
+# -*- coding: utf-8 -*-
+
+"""
+direct Python Toolbox
+All-in-one toolbox to encapsulate Python runtime variants
+----------------------------------------------------------------------------
+(C) direct Netware Group - All rights reserved
+https://www.direct-netware.de/redirect?dpt;runtime
+
+This Source Code Form is subject to the terms of the Mozilla Public License,
+v. 2.0. If a copy of the MPL was not distributed with this file, You can
+obtain one at http://mozilla.org/MPL/2.0/.
+----------------------------------------------------------------------------
+https://www.direct-netware.de/redirect?licenses;mpl2
+----------------------------------------------------------------------------
+unittest
+"""
+
+from socket import socketpair
+import unittest
+
+from dpt_runtime.descriptor_selector import DescriptorSelector
+
+class TestDescriptorSelector(unittest.TestCase):
+    """
+UnitTest for DescriptorSelector
+
+:since: v1.0.4
+    """
+
+    def test_select(self):
+        _socket, peer_socket = socketpair()
+        descriptor = _socket.fileno()
+
+        selector = DescriptorSelector([ descriptor ], [ descriptor ])
+
+        self.assertEqual(( [ ], [ descriptor ], [ ] ), tuple(selector.select(0, False)))
+        self.assertEqual(( [ ], [ ], [ ] ), tuple(selector.select(0, False, is_writable = False)))
+
+        peer_socket.send(b"data")
+
+        self.assertEqual(( [ descriptor ], [ ], [ ] ), tuple(selector.select(1, False, is_writable = False)))
+        self.assertEqual(( [ descriptor ], [ descriptor ], [ ] ), tuple(selector.select(0)))
+
+        _socket.close()
+        peer_socket.close()
+    #
+
+    def test_register(self):
+        sockets = [ socketpair() for _ in range(3) ]
+        descriptors = [ _socket.fileno() for _socket, _ in sockets ]
+
+        selector = DescriptorSelector()
+        selector.register(descriptors[0])
+
+        self.assertEqual([ ], selector.select(0, False)[0])
+
+        for _, peer_socket in sockets: peer_socket.send(b"data")
+
+        selector.register(descriptors[1])
+        selector.register(descriptors[2], False, True)
+
+        self.assertEqual(sorted(descriptors[:2]), sorted(selector.select(0, False)[0]))
+        self.assertEqual([ descriptors[2] ], selector.select(0, False)[1])
+
+        selector.unregister(descriptors[0])
+        selector.register(descriptors[2])
+
+        self.assertEqual(sorted(descriptors[1:]), sorted(selector.select(0, False, is_writable = False)[0]))
+        self.assertEqual(( [ descriptors[1], descriptors[2] ], [ descriptors[2] ] ), tuple(sorted(dlist) for dlist in selector.select(0)[:2]))
+
+        for _socket, peer_socket in sockets:
+            _socket.close()
+            peer_socket.close()
+        #
+    #
+#
+
+if (__name__ == "__main__"):
+    unittest.main()
+#
@@ -0,0 +1,94 @@
+# -*- coding: utf-8 -*-
+
+"""
+direct Python Toolbox
+All-in-one toolbox to encapsulate Python runtime variants
+----------------------------------------------------------------------------
+(C) direct Netware Group - All rights reserved
+https://www.direct-netware.de/redirect?dpt;runtime
+
+This Source Code Form is subject to the terms of the Mozilla Public License,
+v. 2.0. If a copy of the MPL was not distributed with this file, You can
+obtain one at http://mozilla.org/MPL/2.0/.
+----------------------------------------------------------------------------
+https://www.direct-netware.de/redirect?licenses;mpl2
+----------------------------------------------------------------------------
+unittest
+"""
+
+from os import fstat
+import unittest
+
+from dpt_runtime.fifo_byte_buffer import FifoByteBuffer
+
+class TestFifoByteBuffer(unittest.TestCase):
+    """
+UnitTest for FifoByteBuffer
+
+:since: v1.0.4
+    """
+
+    def test_compacted(self):
+        fifo_buffer = FifoByteBuffer()
+        fifo_buffer.file_threshold = 1000
+
+        data = b"".join([ "{0:08d}".format(i).encode("ascii") for i in range(131072) ])
+
+        fifo_buffer.write(data[:1200])
+        read_data = b""
+
+        for i in range(1200, len(data), 100):
+            fifo_buffer.write(data[i:i + 100])
+            read_data += fifo_buffer.read(100)
+
+            buffer_file = fifo_buffer.buffer_file
+            if (buffer_file is not None): self.assertLess(fstat(buffer_file.fileno()).st_size, 4000)
+        #
+
+        read_data += fifo_buffer.read()
+        self.assertEqual(data, read_data)
+    #
+
+    def test_interleaved(self):
+        fifo_buffer = FifoByteBuffer()
+
+        fifo_buffer.write(b"line 1\nline")
+        self.assertEqual(b"line 1\n", fifo_buffer.readline())
+
+        fifo_buffer.write(b" 2\n")
+        self.assertEqual(b"line 2\n", fifo_buffer.read())
+
+        self.assertEqual(b"", fifo_buffer.read())
+        self.assertEqual(0, fifo_buffer.available)
+        self.assertEqual(14, fifo_buffer.tell())
+    #
+
+    def test_spilled(self):
+        fifo_buffer = FifoByteBuffer()
+        fifo_buffer.file_threshold = 16384
+
+        data = b"".join([ "{0:08d}".format(i).encode("ascii") for i in range(8192) ])
+        read_data = b""
+
+        for i in range(0, len(data), 16384):
+            fifo_buffer.write(data[i:i + 8192])
+            fifo_buffer.writev([ data[i + 8192:i + 12288], data[i + 12288:i + 16384] ])
+
+            read_data += fifo_buffer.read(8192)
+        #
+
+        self.assertIsNotNone(fifo_buffer.buffer_file)
+
+        while (fifo_buffer.available > 0):
+            read_data += fifo_buffer.read(4096)
+            fifo_buffer.write(b"")
+        #
+
+        self.assertIsNone(fifo_buffer.buffer_file)
+        self.assertEqual(data, read_data)
+    #
+#
+
+if (__name__ == "__main__"):
+    unittest.main()
+#
@@ -0,0 +1,85 @@
+# -*- coding: utf-8 -*-
+
+"""
+direct Python Toolbox
+All-in-one toolbox to encapsulate Python runtime variants
+----------------------------------------------------------------------------
+(C) direct Netware Group - All rights reserved
+https://www.direct-netware.de/redirect?dpt;runtime
+
+This Source Code Form is subject to the terms of the Mozilla Public License,
+v. 2.0. If a copy of the MPL was not distributed with this file, You can
+obtain one at http://mozilla.org/MPL/2.0/.
+----------------------------------------------------------------------------
+https://www.direct-netware.de/redirect?licenses;mpl2
+----------------------------------------------------------------------------
+unittest
+"""
+
+from socket import socketpair
+from struct import pack
+from threading import Thread
+import unittest
+
+from dpt_runtime.frame_decoder import FrameDecoder
+from dpt_runtime.io_exception import IOException
+from dpt_runtime.socket_reader import SocketReader
+from dpt_runtime.value_exception import ValueException
+
+class TestFrameDecoder(unittest.TestCase):
+    """
+UnitTest for FrameDecoder
+
+:since: v1.0.4
+    """
+
+    messages = [ "message {0:d}".format(i).encode("ascii") * (i % 7) for i in range(5000) ] + [ b"x" * 100000 ]
+    """
+Test messages sent
+    """
+
+    def _get_socket_reader(self, data):
+        _socket, peer_socket = socketpair()
+
+        def _sendall():
+            peer_socket.sendall(data)
+            peer_socket.close()
+        #
+
+        thread = Thread(target = _sendall)
+        thread.start()
+
+        self.addCleanup(_socket.close)
+        self.addCleanup(thread.join)
+
+        return SocketReader(_socket, 5)
+    #
+
+    def test_delimited(self):
+        data = b"".join(message + b"\r\n" for message in TestFrameDecoder.messages)
+        frame_decoder = FrameDecoder(self._get_socket_reader(data + b"incomplete"), delimiter = b"\r\n")
+
+        self.assertEqual(TestFrameDecoder.messages, [ next(frame_decoder) for _ in TestFrameDecoder.messages ])
+        self.assertRaises(IOException, next, frame_decoder)
+
+        frame_decoder = FrameDecoder(self._get_socket_reader(data), delimiter = b"\r\n", max_frame_size = 1000)
+
+        self.assertEqual(TestFrameDecoder.messages[:-1], [ next(frame_decoder) for _ in TestFrameDecoder.messages[:-1] ])
+        self.assertRaises(ValueException, next, frame_decoder)
+    #
+
+    def test_length_prefixed(self):
+        data = b"".join(pack(">I", len(message)) + message for message in TestFrameDecoder.messages)
+        self.assertEqual(TestFrameDecoder.messages, list(FrameDecoder(self._get_socket_reader(data))))
+
+        data = b"".join(pack("<I", len(message))[:3] + message for message in TestFrameDecoder.messages)
+        self.assertEqual(TestFrameDecoder.messages, list(FrameDecoder(self._get_socket_reader(data), 3, "little")))
+
+        frame_decoder = FrameDecoder(self._get_socket_reader(pack(">H", 2000) + b"x" * 2000), 2, max_frame_size = 1000)
+        self.assertRaises(ValueException, next, frame_decoder)
+    #
+#
+
+if (__name__ == "__main__"):
+    unittest.main()
+#
@@ -0,0 +1,218 @@
+# -*- coding: utf-8 -*-
+
+"""
+direct Python Toolbox
+All-in-one toolbox to encapsulate Python runtime variants
+----------------------------------------------------------------------------
+(C) direct Netware Group - All rights reserved
+https://www.direct-netware.de/redirect?dpt;runtime
+
+This Source Code Form is subject to the terms of the Mozilla Public License,
+v. 2.0. If a copy of the MPL was not distributed with this file, You can
+obtain one at http://mozilla.org/MPL/2.0/.
+----------------------------------------------------------------------------
+https://www.direct-netware.de/redirect?licenses;mpl2
+----------------------------------------------------------------------------
+unittest
+"""
+
+from socket import socketpair
+from threading import Thread
+import unittest
+
+from dpt_runtime.byte_buffer import ByteBuffer
+from dpt_runtime.io_exception import IOException
+from dpt_runtime.socket_reader import SocketReader
+
+class TestSocketReader(unittest.TestCase):
+    """
+UnitTest for SocketReader
+
+:since: v1.0.4
+    """
+
+    data = b"".join([ "line {0:d}\n".format(i).encode("ascii") for i in range(50000) ])
+    """
+Test data sent
+    """
+
+    def setUp(self):
+        self.socket, self.peer_socket = socketpair()
+    #
+
+    def tearDown(self):
+        self.socket.close()
+        self.peer_socket.close()
+    #
+
+    def _send(self, data, is_closed = True):
+        def _sendall():
+            self.peer_socket.sendall(data)
+            if (is_closed): self.peer_socket.close()
+        #
+
+        thread = Thread(target = _sendall)
+        thread.start()
+
+        return thread
+    #
+
+    def test_read_ahead(self):
+        data = TestSocketReader.data
+        thread = self._send(data)
+
+        socket_reader = SocketReader(self.socket, 5)
+
+        self.assertEqual(b"line", socket_reader.peek(4))
+        self.assertEqual(b"line 0\n", socket_reader.readline())
+        self.assertEqual(b"line 1", socket_reader.read_until(b"1"))
+        self.assertEqual(b"\n", socket_reader.readline(3))
+        self.assertEqual(b"lin", socket_reader.readline(3))
+        self.assertEqual(b"e 2\nline 3\n", socket_reader.read_until(b"3\n"))
+        self.assertEqual(b"line ", socket_reader.readexactly(5))
+        self.assertEqual(b"4\n", socket_reader.recv(2))
+
+        line_end = data.index(b"\n", 100000) + 1
+        self.assertEqual(data[35:line_end], socket_reader.read_until(data[line_end - 9:line_end]))
+
+        self.assertEqual(data[line_end:-7], socket_reader.readexactly(len(data) - line_end - 7))
+        self.assertEqual(b"line 49999\n"[-7:], socket_reader.readline())
+        self.assertEqual(b"", socket_reader.readline())
+
+        self.assertRaises(IOException, socket_reader.readexactly, 1)
+
+        thread.join()
+    #
+
+    def test_recv(self):
+        thread = self._send(TestSocketReader.data)
+        socket_reader = SocketReader(self.socket, 5)
+
+        self.assertEqual(b"line 0\n", socket_reader.recv(7))
+        self.assertEqual(TestSocketReader.data[7:], socket_reader.recv(len(TestSocketReader.data)))
+
+        thread.join()
+    #
+
+    def test_recv_to(self):
+        data = TestSocketReader.data
+        thread = self._send(data)
+
+        socket_reader = SocketReader(self.socket, 5)
+        self.assertEqual(b"line 0\n", socket_reader.readline())
+
+        byte_buffer = ByteBuffer()
+        byte_buffer.file_threshold = 65536
+
+        self.assertEqual(len(data) - 7, socket_reader.recv_to(byte_buffer, len(data)))
+        self.assertIsNotNone(byte_buffer.buffer_file)
+
+        byte_buffer.seek(0)
+        self.assertEqual(data[7:], byte_buffer.read())
+
+        thread.join()
+    #
+
+    def test_recv_to_short_writes(self):
+        class _ShortWriteTarget(object):
+            def __init__(self):
+                self.data = bytearray()
+                self.types = set()
+            #
+
+            def write(self, b):
+                self.types.add(type(b))
+                self.data += b[:1000]
+
+                return min(len(b), 1000)
+            #
+        #
+
+        data = TestSocketReader.data
+        thread = self._send(data)
+
+        socket_reader = SocketReader(self.socket, 5)
+        self.assertEqual(b"line 0\n", socket_reader.readline())
+
+        target = _ShortWriteTarget()
+
+        self.assertEqual(len(data) - 7, socket_reader.recv_to(target, len(data)))
+        self.assertEqual(data[7:], bytes(target.data))
+        self.assertEqual({ bytes }, target.types)
+
+        thread.join()
+    #
+
+    def test_recvmsg_into(self):
+        data = TestSocketReader.data
+        thread = self._send(data)
+
+        socket_reader = SocketReader(self.socket, 5)
+        self.assertEqual(b"line", socket_reader.peek(4))
+
+        header = bytearray(7)
+        body = bytearray(200000)
+
+        self.assertEqual(200007, socket_reader.recvmsg_into([ header, bytearray(), body ]))
+        self.assertEqual(data[:7], bytes(header))
+        self.assertEqual(data[7:200007], bytes(body))
+
+        self.assertEqual(len(data) - 200007, socket_reader.recvmsg_into([ header, body, bytearray(len(data)) ]))
+        self.assertEqual(data[200007:200014], bytes(header))
+
+        thread.join()
+    #
+
+    def test_tls_pending(self):
+        class _TlsSocket(object):
+            def __init__(self, _socket, data):
+                self.data = data
+                self.socket = _socket
+            #
+
+            def fileno(self):
+                return self.socket.fileno()
+            #
+
+            def pending(self):
+                return len(self.data)
+            #
+
+            def recv_into(self, buffer):
+                size = min(len(buffer), len(self.data))
+
+                buffer[:size] = self.data[:size]
+                self.data = self.data[size:]
+
+                return size
+            #
+        #
+
+        socket_reader = SocketReader(_TlsSocket(self.socket, b"line 0\nline 1\n"), 1)
+
+        self.assertEqual(b"line 0\n", socket_reader.readline())
+        self.assertEqual(b"line 1\n", socket_reader.recv(7))
+        self.assertRaises(IOException, socket_reader.recv, 1)
+    #
+
+    def test_recv_into(self):
+        thread = self._send(TestSocketReader.data[:100], False)
+        socket_reader = SocketReader(self.socket, 1)
+
+        buffer = bytearray(200)
+
+        self.assertEqual(50, socket_reader.recv_into(buffer, 50))
+        self.assertEqual(TestSocketReader.data[:50], bytes(buffer[:50]))
+
+        thread.join()
+
+        self.assertEqual(50, socket_reader.recv_into(memoryview(buffer)[50:100]))
+        self.assertEqual(TestSocketReader.data[:100], bytes(buffer[:100]))
+
+        self.assertRaises(IOException, socket_reader.recv_into, buffer)
+    #
+#
+
+if (__name__ == "__main__"):
+    unittest.main()
+#
@@ -0,0 +1,83 @@
+# -*- coding: utf-8 -*-
+
+"""
+direct Python Toolbox
+All-in-one toolbox to encapsulate Python runtime variants
+----------------------------------------------------------------------------
+(C) direct Netware Group - All rights reserved
+https://www.direct-netware.de/redirect?dpt;runtime
+
+This Source Code Form is subject to the terms of the Mozilla Public License,
+v. 2.0. If a copy of the MPL was not distributed with this file, You can
+obtain one at http://mozilla.org/MPL/2.0/.
+----------------------------------------------------------------------------
+https://www.direct-netware.de/redirect?licenses;mpl2
+----------------------------------------------------------------------------
+unittest
+"""
+
+from socket import socketpair
+from threading import Timer
+import unittest
+
+from dpt_runtime.socket_reader import SocketReader
+from dpt_runtime.socket_reader_multiplexer import SocketReaderMultiplexer
+
+class TestSocketReaderMultiplexer(unittest.TestCase):
+    """
+UnitTest for SocketReaderMultiplexer
+
+:since: v1.0.4
+    """
+
+    def setUp(self):
+        self.multiplexer = SocketReaderMultiplexer()
+        self.socket_pairs = [ socketpair() for _ in range(3) ]
+        self.socket_readers = [ SocketReader(socket_pair[0], 5) for socket_pair in self.socket_pairs ]
+    #
+
+    def tearDown(self):
+        self.multiplexer.close()
+
+        for socket_pair in self.socket_pairs:
+            socket_pair[0].close()
+            socket_pair[1].close()
+        #
+    #
+
+    def test_events(self):
+        ready_reader, timeout_reader, idle_reader = self.socket_readers
+
+        self.multiplexer.register(ready_reader)
+        self.multiplexer.register(timeout_reader, 0.2)
+        self.multiplexer.register(idle_reader)
+
+        self.assertEqual(3, len(self.multiplexer))
+        self.assertEqual([ ], self.multiplexer.select(0))
+
+        self.socket_pairs[0][1].send(b"line 0\nline 1\n")
+
+        self.assertEqual([ ( ready_reader, SocketReaderMultiplexer.EVENT_READY ) ], self.multiplexer.select(1))
+        self.assertEqual([ ( timeout_reader, SocketReaderMultiplexer.EVENT_TIMEOUT ) ], self.multiplexer.select(1))
+        self.assertEqual(1, len(self.multiplexer))
+
+        self.assertEqual(b"line 0\n", ready_reader.readline())
+
+        self.multiplexer.register(ready_reader)
+        self.assertEqual([ ( ready_reader, SocketReaderMultiplexer.EVENT_READY ) ], self.multiplexer.select(0))
+
+        self.multiplexer.unregister(idle_reader)
+
+        timer = Timer(0.2, self.multiplexer.register, args = ( timeout_reader, 0.1 ))
+        timer.start()
+
+        self.assertEqual([ ( timeout_reader, SocketReaderMultiplexer.EVENT_TIMEOUT ) ], self.multiplexer.select())
+        self.assertEqual(0, len(self.multiplexer))
+
+        timer.join()
+    #
+#
+
+if (__name__ == "__main__"):
+    unittest.main()
+#